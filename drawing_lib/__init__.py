@@ -4,15 +4,30 @@ Drawing library for vector graphics with Pydantic models.
 
 __version__ = "0.1.0"
 
+# Fast copy/construct paths (model_copy, model_construct) require Pydantic v2
+import pydantic
+
+if int(pydantic.VERSION.split(".")[0]) < 2:
+    raise ImportError(
+        f"drawing_lib requires pydantic>=2.0.0, found {pydantic.VERSION}"
+    )
+
 # Export main components
 from .types import ShapeType, BlendMode, LineCap, LineJoin, FillType, Units
 from .styles import (
     RGBColor, RGBAColor, HSLColor, HexColor,
     LinearGradient, RadialGradient, PatternFill,
-    FillProperties, StrokeProperties, Effects
+    FillProperties, StrokeProperties, Effects,
+    make_rgb, make_rgba, solid_fill, solid_stroke
+)
+from .shapes import (
+    Shape, Transform, StyleProperties,
+    RectangleGeometry, CircleGeometry, EllipseGeometry, LineGeometry,
+    PolylineGeometry, PolygonGeometry, PathGeometry, GroupGeometry, Geometry
 )
-from .shapes import Shape, Transform, StyleProperties
 from .layers import Layer, LayerGroup, LayerManager
+from .spatial import SpatialIndex
+from .soa import SoALayer
 from .document import (
     CanvasSize, BackgroundProperties, DocumentMetadata, ViewSettings,
     ExportSettings, DrawingDocument
@@ -23,8 +38,11 @@ __all__ = [
     "RGBColor", "RGBAColor", "HSLColor", "HexColor",
     "LinearGradient", "RadialGradient", "PatternFill",
     "FillProperties", "StrokeProperties", "Effects",
+    "make_rgb", "make_rgba", "solid_fill", "solid_stroke",
     "Shape", "Transform", "StyleProperties",
-    "Layer", "LayerGroup", "LayerManager",
+    "RectangleGeometry", "CircleGeometry", "EllipseGeometry", "LineGeometry",
+    "PolylineGeometry", "PolygonGeometry", "PathGeometry", "GroupGeometry", "Geometry",
+    "Layer", "LayerGroup", "LayerManager", "SpatialIndex", "SoALayer",
     "CanvasSize", "BackgroundProperties", "DocumentMetadata", "ViewSettings",
     "ExportSettings", "DrawingDocument"
 ]
\ No newline at end of file
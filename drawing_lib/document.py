@@ -2,58 +2,112 @@
 Drawing document model with canvas properties, metadata, and version management.
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+import json
+import time
+from typing import Optional, Dict, Any, Iterator, List, TextIO, Tuple, TypedDict
+from contextlib import contextmanager
 from datetime import datetime
-from pydantic import BaseModel, Field, model_validator
+from functools import cached_property, lru_cache
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from .types import ID, Units, generate_id
 from .styles import Color, RGBColor
 from .layers import LayerManager
 
 
+# Inches per unit for DPI-based conversions; pixels need no conversion
+_UNIT_TO_INCHES = {
+    Units.INCHES: 1.0,
+    Units.MILLIMETERS: 1.0 / 25.4,
+    Units.CENTIMETERS: 1.0 / 2.54,
+    Units.POINTS: 1.0 / 72.0,
+}
+
+
+@lru_cache(maxsize=64)
+def _to_pixels_cached(width: float, height: float, units: Units, dpi: float) -> Tuple[float, float]:
+    """Convert a (width, height, units) triple to pixels, memoized per canvas/DPI."""
+    inches_per_unit = _UNIT_TO_INCHES.get(units)
+    if inches_per_unit is None:
+        # Pixels (or unknown unit): no conversion
+        return (width, height)
+
+    factor = inches_per_unit * dpi
+    return (width * factor, height * factor)
+
+
 class CanvasSize(BaseModel):
-    """Canvas size with units."""
-    
+    """
+    Canvas size with units.
+
+    Frozen after construction so derived values (aspect ratio, pixel
+    dimensions) can be cached safely; resizing constructs a new instance
+    (see `DrawingDocument.set_canvas_size`).
+    """
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     width: float = Field(..., gt=0.0, description="Canvas width")
     height: float = Field(..., gt=0.0, description="Canvas height")
     units: Units = Field(Units.PIXELS, description="Measurement units")
-    
+
     def to_pixels(self, dpi: float = 96.0) -> Tuple[float, float]:
         """
         Convert canvas size to pixels.
-        
+
         Args:
             dpi: Dots per inch for conversion
-            
+
         Returns:
             Tuple of (width_px, height_px)
         """
-        if self.units == Units.PIXELS:
-            return (self.width, self.height)
-        elif self.units == Units.INCHES:
-            return (self.width * dpi, self.height * dpi)
-        elif self.units == Units.MILLIMETERS:
-            # 1 inch = 25.4 mm
-            inches_width = self.width / 25.4
-            inches_height = self.height / 25.4
-            return (inches_width * dpi, inches_height * dpi)
-        elif self.units == Units.CENTIMETERS:
-            # 1 inch = 2.54 cm
-            inches_width = self.width / 2.54
-            inches_height = self.height / 2.54
-            return (inches_width * dpi, inches_height * dpi)
-        elif self.units == Units.POINTS:
-            # 1 inch = 72 points
-            inches_width = self.width / 72.0
-            inches_height = self.height / 72.0
-            return (inches_width * dpi, inches_height * dpi)
-        else:
-            # Default to pixels if unknown unit
-            return (self.width, self.height)
-    
+        return _to_pixels_cached(self.width, self.height, self.units, dpi)
+
+    @cached_property
+    def aspect_ratio(self) -> float:
+        """Aspect ratio (width/height), computed once per canvas."""
+        return self.width / self.height
+
+    @cached_property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Canvas bounds (min_x, min_y, max_x, max_y), built once per canvas."""
+        return (0.0, 0.0, self.width, self.height)
+
+    @cached_property
+    def center(self) -> Tuple[float, float]:
+        """Canvas center point (center_x, center_y), built once per canvas."""
+        return (self.width / 2.0, self.height / 2.0)
+
+    @cached_property
+    def description(self) -> str:
+        """Human-readable size string (e.g. '800.0x600.0 px'), built once per canvas."""
+        return f"{self.width}x{self.height} {self.units.value}"
+
+    @cached_property
+    def aspect_ratio_rounded(self) -> float:
+        """Aspect ratio rounded to two decimals, computed once per canvas."""
+        return round(self.width / self.height, 2)
+
     def get_aspect_ratio(self) -> float:
         """Get the aspect ratio (width/height)."""
-        return self.width / self.height
+        return self.aspect_ratio
+
+
+# Preset canvas sizes, prebuilt once. CanvasSize is frozen so the shared
+# instances are safe to hand out; create_preset only reads their fields.
+_PRESETS: Dict[str, CanvasSize] = {
+    "web": CanvasSize.model_construct(width=1920.0, height=1080.0, units=Units.PIXELS),
+    "web_hd": CanvasSize.model_construct(width=1920.0, height=1080.0, units=Units.PIXELS),
+    "web_4k": CanvasSize.model_construct(width=3840.0, height=2160.0, units=Units.PIXELS),
+    "mobile": CanvasSize.model_construct(width=375.0, height=667.0, units=Units.PIXELS),
+    "tablet": CanvasSize.model_construct(width=768.0, height=1024.0, units=Units.PIXELS),
+    "print_letter": CanvasSize.model_construct(width=8.5, height=11.0, units=Units.INCHES),
+    "print_a4": CanvasSize.model_construct(width=210.0, height=297.0, units=Units.MILLIMETERS),
+    "print_a3": CanvasSize.model_construct(width=297.0, height=420.0, units=Units.MILLIMETERS),
+    "social_instagram": CanvasSize.model_construct(width=1080.0, height=1080.0, units=Units.PIXELS),
+    "social_facebook": CanvasSize.model_construct(width=1200.0, height=630.0, units=Units.PIXELS),
+    "social_twitter": CanvasSize.model_construct(width=1024.0, height=512.0, units=Units.PIXELS),
+}
 
 
 class BackgroundProperties(BaseModel):
@@ -74,27 +128,107 @@ class BackgroundProperties(BaseModel):
         return self
 
 
+class WellKnownProperties(TypedDict, total=False):
+    """
+    Well-known custom property keys.
+
+    A TypedDict rather than a nested BaseModel: these values live inside
+    the free-form `custom_properties` bag and a plain dict view avoids
+    per-document model validation for leaf metadata.
+    """
+
+    license: str
+    copyright: str
+    source: str
+
+
 class DocumentMetadata(BaseModel):
     """Document metadata and version information."""
-    
+
+    model_config = ConfigDict(validate_assignment=False)
+
     title: str = Field("Untitled Document", description="Document title")
     description: Optional[str] = Field(None, description="Document description")
     author: Optional[str] = Field(None, description="Document author")
     keywords: List[str] = Field(default_factory=list, description="Document keywords/tags")
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
-    modified_at: datetime = Field(default_factory=datetime.now, description="Last modification timestamp")
+    created_at: Optional[datetime] = Field(None, description="Creation timestamp (stamped on first validation)")
+    modified_at: Optional[datetime] = Field(None, description="Last modification timestamp (stamped on first validation)")
     version: str = Field("1.0", description="Document version")
     app_version: str = Field("0.1.0", description="Application version that created/modified this document")
     custom_properties: Dict[str, Any] = Field(default_factory=dict, description="Custom metadata properties")
-    
+
+    # Timestamp coalescing state: batched edits defer the datetime.now() call,
+    # and back-to-back touches within a millisecond reuse the previous stamp
+    _batch_depth: int = PrivateAttr(default=0)
+    _touch_pending: bool = PrivateAttr(default=False)
+    _last_touch_monotonic: float = PrivateAttr(default=0.0)
+
+    @model_validator(mode='after')
+    def init_timestamps(self) -> 'DocumentMetadata':
+        """Stamp missing timestamps with a single datetime.now() call.
+
+        Loading serialized metadata supplies both values, so deserialization
+        pays no syscall; fresh construction takes one instead of two
+        default_factory invocations.
+        """
+        if self.created_at is None or self.modified_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                object.__setattr__(self, 'created_at', now)
+            if self.modified_at is None:
+                object.__setattr__(self, 'modified_at', now)
+        return self
+
     def update_modified_time(self) -> None:
         """Update the modified timestamp to now."""
-        self.modified_at = datetime.now()
+        if self._batch_depth > 0:
+            self._touch_pending = True
+            return
+
+        now_monotonic = time.monotonic()
+        if now_monotonic - self._last_touch_monotonic < 0.001:
+            # Coalesce sub-millisecond touches; datetime.now() costs a syscall
+            return
+
+        self._last_touch_monotonic = now_monotonic
+        # Bypass the pydantic __setattr__ hook; every mutating operation on
+        # DrawingDocument lands here and the value needs no validation
+        object.__setattr__(self, 'modified_at', datetime.now())
+
+    def begin_batch(self) -> None:
+        """Start deferring timestamp updates (see DrawingDocument.batch_edit)."""
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """Stop deferring timestamp updates, applying any pending touch."""
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth == 0 and self._touch_pending:
+            self._touch_pending = False
+            self._last_touch_monotonic = time.monotonic()
+            object.__setattr__(self, 'modified_at', datetime.now())
+
+    @property
+    def well_known(self) -> WellKnownProperties:
+        """Typed view of the well-known keys in custom_properties."""
+        props = self.custom_properties
+        view: WellKnownProperties = {}
+        for key in ('license', 'copyright', 'source'):
+            value = props.get(key)
+            if isinstance(value, str):
+                view[key] = value
+        return view
+
+
+# Assignable metadata fields, computed once so update_metadata can filter
+# kwargs with a set lookup instead of per-key hasattr probes
+_METADATA_FIELDS = frozenset(DocumentMetadata.model_fields.keys())
 
 
 class ViewSettings(BaseModel):
     """View settings for the document canvas."""
-    
+
+    model_config = ConfigDict(extra='forbid')
+
     zoom_level: float = Field(1.0, gt=0.0, description="Zoom level (1.0 = 100%)")
     pan_x: float = Field(0.0, description="Horizontal pan offset")
     pan_y: float = Field(0.0, description="Vertical pan offset")
@@ -104,12 +238,28 @@ class ViewSettings(BaseModel):
     snap_to_grid: bool = Field(False, description="Whether to snap to grid")
     snap_to_guides: bool = Field(True, description="Whether to snap to guides")
     grid_size: float = Field(10.0, gt=0.0, description="Grid size in canvas units")
-    grid_color: Color = Field(default_factory=lambda: RGBColor(r=200, g=200, b=200), description="Grid color")
+    grid_color_packed: int = Field(0xC8C8C8FF, ge=0, le=0xFFFFFFFF, description="Grid color packed as RGBA uint32")
+
+    @property
+    def grid_color(self) -> RGBColor:
+        """Grid color unpacked from the uint32 storage form."""
+        packed = self.grid_color_packed
+        return RGBColor.model_construct(
+            r=(packed >> 24) & 0xFF,
+            g=(packed >> 16) & 0xFF,
+            b=(packed >> 8) & 0xFF,
+        )
+
+    def set_grid_color(self, color: RGBColor) -> None:
+        """Set the grid color from an RGBColor."""
+        self.grid_color_packed = (color.r << 24) | (color.g << 16) | (color.b << 8) | 0xFF
 
 
 class ExportSettings(BaseModel):
     """Export settings for the document."""
-    
+
+    model_config = ConfigDict(extra='forbid')
+
     default_format: str = Field("svg", description="Default export format")
     dpi: float = Field(96.0, gt=0.0, description="Default DPI for raster exports")
     quality: float = Field(0.9, ge=0.0, le=1.0, description="Export quality for lossy formats")
@@ -128,7 +278,9 @@ class DrawingDocument(BaseModel):
     - View and export settings
     - Full serialization support
     """
-    
+
+    model_config = ConfigDict(extra='forbid', validate_assignment=False)
+
     id: ID = Field(default_factory=generate_id, description="Unique document identifier")
     canvas: CanvasSize = Field(..., description="Canvas size and units")
     background: BackgroundProperties = Field(default_factory=BackgroundProperties, description="Background properties")  # type: ignore
@@ -139,10 +291,7 @@ class DrawingDocument(BaseModel):
     
     def get_total_shape_count(self) -> int:
         """Get total number of shapes in the document."""
-        total = 0
-        for layer in self.layer_manager.get_all_layers():
-            total += layer.get_shape_count()
-        return total
+        return sum(layer.get_shape_count() for layer in self.layer_manager.get_all_layers())
     
     def get_canvas_bounds(self) -> Tuple[float, float, float, float]:
         """
@@ -151,16 +300,16 @@ class DrawingDocument(BaseModel):
         Returns:
             Tuple of (min_x, min_y, max_x, max_y)
         """
-        return (0.0, 0.0, self.canvas.width, self.canvas.height)
-    
+        return self.canvas.bounds
+
     def get_canvas_center(self) -> Tuple[float, float]:
         """
         Get canvas center point.
-        
+
         Returns:
             Tuple of (center_x, center_y)
         """
-        return (self.canvas.width / 2.0, self.canvas.height / 2.0)
+        return self.canvas.center
     
     def update_metadata(self, **kwargs: Any) -> None:
         """
@@ -169,12 +318,28 @@ class DrawingDocument(BaseModel):
         Args:
             **kwargs: Metadata fields to update
         """
+        metadata = self.metadata
         for key, value in kwargs.items():
-            if hasattr(self.metadata, key):
-                setattr(self.metadata, key, value)
-        
-        self.metadata.update_modified_time()
+            if key in _METADATA_FIELDS:
+                setattr(metadata, key, value)
+
+        metadata.update_modified_time()
     
+    @contextmanager
+    def batch_edit(self) -> Iterator['DrawingDocument']:
+        """
+        Coalesce metadata timestamp updates across a batch of edits.
+
+        Within the block, mutating operations mark the document dirty
+        without calling datetime.now(); a single timestamp is taken when
+        the block exits.
+        """
+        self.metadata.begin_batch()
+        try:
+            yield self
+        finally:
+            self.metadata.end_batch()
+
     def set_canvas_size(self, width: float, height: float, units: Units = Units.PIXELS) -> None:
         """
         Set canvas size and update metadata.
@@ -183,8 +348,12 @@ class DrawingDocument(BaseModel):
             width: Canvas width
             height: Canvas height
             units: Measurement units
+
+        Note:
+            Arguments are trusted and bypass field validation; use
+            `CanvasSize` directly for untrusted input.
         """
-        self.canvas = CanvasSize(width=width, height=height, units=units)
+        self.canvas = CanvasSize.model_construct(width=width, height=height, units=units)
         self.metadata.update_modified_time()
     
     def create_layer(self, name: str, **kwargs: Any) -> Any:
@@ -217,6 +386,33 @@ class DrawingDocument(BaseModel):
         self.metadata.update_modified_time()
         return group
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the document straight to JSON bytes.
+
+        Uses pydantic-core's Rust serializer directly, skipping the
+        intermediate Python dict that model_dump() would build. Preferred
+        for export paths that write to disk or the network.
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        return self.__pydantic_serializer__.to_json(self)
+
+    def dump_json_to(self, fp: TextIO, indent: Optional[int] = 2) -> int:
+        """
+        Serialize the document as JSON directly into a text file object.
+
+        Streams via json.dump instead of materializing the full JSON
+        string in memory first, which matters for large documents.
+
+        Returns:
+            Number of characters written
+        """
+        start = fp.tell()
+        json.dump(self.model_dump(mode='json'), fp, indent=indent)
+        return fp.tell() - start
+
     def get_document_info(self) -> Dict[str, Any]:
         """
         Get summary information about the document.
@@ -224,17 +420,24 @@ class DrawingDocument(BaseModel):
         Returns:
             Dictionary with document statistics and info
         """
+        layer_count, shape_count, visible_count, _ = self.layer_manager.summary()
+
+        # The metadata validator stamps both timestamps on first validation,
+        # but the fields are Optional, so guard for unvalidated instances
+        created_at = self.metadata.created_at
+        modified_at = self.metadata.modified_at
+
         return {
             "id": self.id,
             "title": self.metadata.title,
-            "canvas_size": f"{self.canvas.width}x{self.canvas.height} {self.canvas.units.value}",
-            "canvas_aspect_ratio": round(self.canvas.get_aspect_ratio(), 2),
-            "total_layers": self.layer_manager.get_layer_count(),
-            "total_shapes": self.get_total_shape_count(),
-            "visible_layers": len(self.layer_manager.get_visible_layers()),
+            "canvas_size": self.canvas.description,
+            "canvas_aspect_ratio": self.canvas.aspect_ratio_rounded,
+            "total_layers": layer_count,
+            "total_shapes": shape_count,
+            "visible_layers": visible_count,
             "background_transparent": self.background.transparent,
-            "created_at": self.metadata.created_at.isoformat(),
-            "modified_at": self.metadata.modified_at.isoformat(),
+            "created_at": created_at.isoformat() if created_at else None,
+            "modified_at": modified_at.isoformat() if modified_at else None,
             "version": self.metadata.version,
             "app_version": self.metadata.app_version
         }
@@ -261,17 +464,33 @@ class DrawingDocument(BaseModel):
         if total_pixels > 100_000_000:  # 100 megapixels
             issues["warnings"].append("Very large canvas may impact performance")
         
-        # Check for empty document
-        if self.get_total_shape_count() == 0:
+        # Check for empty document and layers without shapes in one pass
+        _, shape_count, _, empty_layer_names = self.layer_manager.summary()
+        if shape_count == 0:
             issues["warnings"].append("Document contains no shapes")
-        
-        # Check for layers without shapes
-        empty_layers = [layer.name for layer in self.layer_manager.get_all_layers() if layer.is_empty()]
-        if empty_layers:
-            issues["warnings"].append(f"Empty layers found: {', '.join(empty_layers)}")
+
+        if empty_layer_names:
+            issues["warnings"].append(f"Empty layers found: {', '.join(empty_layer_names)}")
         
         return issues
     
+    @classmethod
+    def validate_batch(cls, documents: List['DrawingDocument']) -> List[Dict[str, List[str]]]:
+        """
+        Validate many documents in one pass.
+
+        Bulk loading hits the canvas-size checks repeatedly; validating as
+        a batch lets the cached pixel conversion dedupe the per-canvas
+        arithmetic across documents sharing the same geometry.
+
+        Args:
+            documents: Documents to validate
+
+        Returns:
+            List of validation-issue dictionaries, in input order
+        """
+        return [doc.validate_document() for doc in documents]
+
     def cleanup_empty_layers(self) -> int:
         """
         Remove empty layers from the document.
@@ -279,9 +498,10 @@ class DrawingDocument(BaseModel):
         Returns:
             Number of layers removed
         """
-        empty_layers = [layer for layer in self.layer_manager.get_all_layers() if layer.is_empty()]
+        # Materialize before deleting; removal mutates the tree being walked
+        empty_layers = list(self.layer_manager.iter_empty_layers())
         removed_count = 0
-        
+
         for layer in empty_layers:
             if self.layer_manager.delete_layer(layer.id):
                 removed_count += 1
@@ -312,9 +532,18 @@ class DrawingDocument(BaseModel):
             
         Returns:
             New DrawingDocument instance
+
+        Note:
+            Arguments are trusted code-supplied values and bypass field
+            validation; `model_validate` remains the entry point for
+            untrusted input (e.g. loading from JSON).
         """
-        canvas = CanvasSize(width=width, height=height, units=units)
-        metadata = DocumentMetadata(title=title, author=author)  # type: ignore
+        canvas = CanvasSize.model_construct(width=width, height=height, units=units)
+        # model_construct skips validators, so stamp the timestamps here
+        now = datetime.now()
+        metadata = DocumentMetadata.model_construct(
+            title=title, author=author, created_at=now, modified_at=now
+        )
         
         doc = cls(canvas=canvas, metadata=metadata)
         
@@ -335,26 +564,18 @@ class DrawingDocument(BaseModel):
         Returns:
             New DrawingDocument instance
         """
-        presets = {
-            "web": {"width": 1920.0, "height": 1080.0, "units": Units.PIXELS},
-            "web_hd": {"width": 1920.0, "height": 1080.0, "units": Units.PIXELS},
-            "web_4k": {"width": 3840.0, "height": 2160.0, "units": Units.PIXELS},
-            "mobile": {"width": 375.0, "height": 667.0, "units": Units.PIXELS},
-            "tablet": {"width": 768.0, "height": 1024.0, "units": Units.PIXELS},
-            "print_letter": {"width": 8.5, "height": 11.0, "units": Units.INCHES},
-            "print_a4": {"width": 210.0, "height": 297.0, "units": Units.MILLIMETERS},
-            "print_a3": {"width": 297.0, "height": 420.0, "units": Units.MILLIMETERS},
-            "social_instagram": {"width": 1080.0, "height": 1080.0, "units": Units.PIXELS},
-            "social_facebook": {"width": 1200.0, "height": 630.0, "units": Units.PIXELS},
-            "social_twitter": {"width": 1024.0, "height": 512.0, "units": Units.PIXELS},
+        try:
+            canvas = _PRESETS[preset]
+        except KeyError:
+            raise ValueError(f"Unknown preset: {preset}. Available: {list(_PRESETS)}") from None
+
+        merged_config = {
+            "width": canvas.width,
+            "height": canvas.height,
+            "units": canvas.units,
+            **kwargs,
         }
-        
-        if preset not in presets:
-            raise ValueError(f"Unknown preset: {preset}. Available: {list(presets.keys())}")
-        
-        preset_config = presets[preset]
-        merged_config = {**preset_config, **kwargs}
-        
+
         return cls.create_new(**merged_config)
     
     def duplicate(self, new_title: Optional[str] = None) -> 'DrawingDocument':
@@ -367,13 +588,10 @@ class DrawingDocument(BaseModel):
         Returns:
             New DrawingDocument instance
         """
-        # Serialize and deserialize to create a deep copy
-        doc_data = self.model_dump()
-        
-        # Create new document with fresh ID and metadata
-        new_doc = DrawingDocument.model_validate(doc_data)
-        new_doc.id = generate_id()
-        
+        # Deep-copy without re-running validation; the source document is
+        # already validated so a serialize/validate round-trip is wasted work
+        new_doc = self.model_copy(deep=True, update={"id": generate_id()})
+
         if new_title:
             new_doc.metadata.title = new_title
         else:
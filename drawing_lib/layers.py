@@ -2,11 +2,18 @@
 Layer management system for organizing shapes with z-ordering and hierarchy.
 """
 
-from typing import List, Optional, Union, Any, Dict
-from pydantic import BaseModel, Field
+import operator
+from collections import deque
+from itertools import chain, islice
+from typing import ClassVar, Iterable, Iterator, List, Optional, Set, Union, Any, Dict, Tuple, cast
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .types import ID, BlendMode, generate_id
 from .shapes import Shape
+from .spatial import Bounds, SpatialIndex
+
+# Sort key for z-ordering; attrgetter avoids per-element lambda frames
+_zkey = operator.attrgetter('z_index')
 
 
 class Layer(BaseModel):
@@ -20,7 +27,11 @@ class Layer(BaseModel):
     - Opacity and blend mode effects
     - Layer naming and metadata
     """
-    
+
+    # Node tag for tree traversals; comparing this beats isinstance on
+    # pydantic models, which walks the MRO for every node
+    _kind: ClassVar[str] = 'layer'
+
     id: ID = Field(default_factory=generate_id, description="Unique layer identifier")
     name: str = Field(..., description="Layer name")
     shapes: List[Union[ID, Shape]] = Field(default_factory=list, description="Shapes in this layer")
@@ -30,26 +41,89 @@ class Layer(BaseModel):
     opacity: float = Field(1.0, ge=0.0, le=1.0, description="Layer opacity")
     blend_mode: BlendMode = Field(BlendMode.NORMAL, description="Layer blend mode")
     parent_id: Optional[ID] = Field(None, description="Parent layer group ID")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional layer metadata")
-    
+    # Lazy: None until first written, saving an empty-dict allocation per
+    # layer in the (dominant) no-metadata case
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional layer metadata")
+
+    # Shape id membership set mirroring self.shapes, for O(1) duplicate and
+    # removal checks instead of linear scans with model equality
+    _shape_ids: Set[ID] = PrivateAttr(default_factory=set)
+    # Owning manager backref (set when attached to a manager's tree) so
+    # shape-count and visibility changes can invalidate cached statistics
+    _manager: Optional[Any] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Seed the membership set from shapes provided at construction."""
+        self._shape_ids = {
+            shape.id if isinstance(shape, Shape) else shape
+            for shape in self.shapes
+        }
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Reassigning the shapes list replaces the membership, so the id
+        # set must be reseeded to match
+        if name == 'shapes':
+            self._shape_ids = {
+                shape.id if isinstance(shape, Shape) else shape
+                for shape in value
+            }
+        # Field writes that change layer statistics invalidate the
+        # manager's cached summary
+        if name in ('shapes', 'visible', 'name') and self._manager is not None:
+            self._manager._invalidate_summary()
+
+    def _notify_shapes_changed(self) -> None:
+        """Tell the owning manager (if any) that shape counts changed."""
+        if self._manager is not None:
+            self._manager._invalidate_summary()
+
     def add_shape(self, shape: Union[Shape, ID]) -> None:
-        """Add a shape to this layer."""
-        if shape not in self.shapes:
-            self.shapes.append(shape)
-    
+        """Add a shape to this layer (no-op if already present)."""
+        sid = shape.id if isinstance(shape, Shape) else shape
+        if sid in self._shape_ids:
+            return
+        self._shape_ids.add(sid)
+        self.shapes.append(shape)
+        self._notify_shapes_changed()
+
+    def add_shapes(self, shapes: Iterable[Union[Shape, ID]]) -> None:
+        """
+        Add many shapes in one call (duplicates are skipped).
+
+        Appends via a single list.extend instead of one add_shape call
+        per shape, which matters for bulk document builders.
+        """
+        seen = self._shape_ids
+        fresh = []
+        for shape in shapes:
+            sid = shape.id if isinstance(shape, Shape) else shape
+            if sid not in seen:
+                seen.add(sid)
+                fresh.append(shape)
+        self.shapes.extend(fresh)
+        if fresh:
+            self._notify_shapes_changed()
+
     def remove_shape(self, shape: Union[Shape, ID]) -> bool:
         """
         Remove a shape from this layer.
-        
+
         Returns:
             True if shape was found and removed, False otherwise
         """
-        try:
-            self.shapes.remove(shape)
-            return True
-        except ValueError:
+        sid = shape.id if isinstance(shape, Shape) else shape
+        if sid not in self._shape_ids:
             return False
-    
+        self._shape_ids.discard(sid)
+        for i, existing in enumerate(self.shapes):
+            existing_id = existing.id if isinstance(existing, Shape) else existing
+            if existing_id == sid:
+                del self.shapes[i]
+                self._notify_shapes_changed()
+                return True
+        return False
+
     def move_shape(self, shape: Union[Shape, ID], new_index: int) -> bool:
         """
         Move a shape to a new position within the layer.
@@ -61,16 +135,24 @@ class Layer(BaseModel):
         Returns:
             True if shape was found and moved, False otherwise
         """
-        try:
-            current_index = self.shapes.index(shape)
-            shape_obj = self.shapes.pop(current_index)
-            
-            # Clamp index to valid range
-            new_index = max(0, min(new_index, len(self.shapes)))
-            self.shapes.insert(new_index, shape_obj)
-            return True
-        except ValueError:
+        sid = shape.id if isinstance(shape, Shape) else shape
+        if sid not in self._shape_ids:
             return False
+
+        # Locate by id instead of list.index to avoid pydantic model
+        # equality comparisons against every preceding entry
+        for i, existing in enumerate(self.shapes):
+            existing_id = existing.id if isinstance(existing, Shape) else existing
+            if existing_id == sid:
+                if i == new_index:
+                    return True
+                shape_obj = self.shapes.pop(i)
+
+                # Clamp index to valid range
+                new_index = max(0, min(new_index, len(self.shapes)))
+                self.shapes.insert(new_index, shape_obj)
+                return True
+        return False
     
     def get_shape_count(self) -> int:
         """Get the number of shapes in this layer."""
@@ -83,21 +165,23 @@ class Layer(BaseModel):
     def clear_shapes(self) -> None:
         """Remove all shapes from this layer."""
         self.shapes.clear()
-    
+        self._shape_ids.clear()
+        self._notify_shapes_changed()
+
     def get_shape_ids(self) -> List[ID]:
         """
         Get list of shape IDs in this layer.
-        
+
         Returns:
-            List of shape IDs, extracting IDs from Shape objects when needed
+            List of shape IDs (unordered), taken from the membership set
         """
-        ids = []
-        for shape in self.shapes:
-            if isinstance(shape, Shape):
-                ids.append(shape.id)
-            else:
-                ids.append(shape)
-        return ids
+        return list(self._shape_ids)
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get the metadata dict, allocating it on first use."""
+        if self.metadata is None:
+            self.metadata = {}
+        return self.metadata
 
 
 class LayerGroup(BaseModel):
@@ -110,7 +194,10 @@ class LayerGroup(BaseModel):
     - Group-level transformations and effects
     - Expanded/collapsed display states
     """
-    
+
+    # See Layer._kind
+    _kind: ClassVar[str] = 'group'
+
     id: ID = Field(default_factory=generate_id, description="Unique group identifier")
     name: str = Field(..., description="Group name")
     children: List[Union['LayerGroup', Layer]] = Field(default_factory=list, description="Child layers and groups")
@@ -121,13 +208,55 @@ class LayerGroup(BaseModel):
     opacity: float = Field(1.0, ge=0.0, le=1.0, description="Group opacity")
     blend_mode: BlendMode = Field(BlendMode.NORMAL, description="Group blend mode")
     parent_id: Optional[ID] = Field(None, description="Parent group ID")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional group metadata")
-    
+    # Lazy: see Layer.metadata
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional group metadata")
+
+    # Backref to the owning LayerManager (if any) so structural mutations can
+    # invalidate its cached flat layer list
+    _manager: Optional[Any] = PrivateAttr(default=None)
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get the metadata dict, allocating it on first use."""
+        if self.metadata is None:
+            self.metadata = {}
+        return self.metadata
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Reassigning the children list replaces the subtree, so the
+        # manager backref must be re-propagated over the new children and
+        # the manager's structural caches dropped (mirrors Layer.shapes)
+        if name == 'children':
+            self._attach_manager(self._manager)
+            self._notify_structure_changed()
+
+    def _attach_manager(self, manager: Optional[Any]) -> None:
+        """Propagate the owning manager backref through this subtree."""
+        stack: "deque[LayerGroup]" = deque([self])
+        while stack:
+            group = stack.pop()
+            group._manager = manager
+            for child in group.children:
+                if child._kind == 'group':
+                    stack.append(cast('LayerGroup', child))
+                else:
+                    child._manager = manager
+
+    def _notify_structure_changed(self) -> None:
+        """Tell the owning manager (if any) that the layer tree changed."""
+        if self._manager is not None:
+            self._manager._invalidate_layer_cache()
+
     def add_child(self, child: Union['LayerGroup', Layer]) -> None:
         """Add a child layer or group."""
         child.parent_id = self.id
         self.children.append(child)
-    
+        if child._kind == 'group':
+            cast('LayerGroup', child)._attach_manager(self._manager)
+        else:
+            child._manager = self._manager
+        self._notify_structure_changed()
+
     def remove_child(self, child: Union['LayerGroup', Layer, ID]) -> bool:
         """
         Remove a child layer or group.
@@ -143,12 +272,22 @@ class LayerGroup(BaseModel):
                 if existing_child.id == child:
                     removed_child = self.children.pop(i)
                     removed_child.parent_id = None
+                    if removed_child._kind == 'group':
+                        cast('LayerGroup', removed_child)._attach_manager(None)
+                    else:
+                        removed_child._manager = None
+                    self._notify_structure_changed()
                     return True
             return False
         else:
             try:
                 self.children.remove(child)
                 child.parent_id = None
+                if child._kind == 'group':
+                    cast('LayerGroup', child)._attach_manager(None)
+                else:
+                    child._manager = None
+                self._notify_structure_changed()
                 return True
             except ValueError:
                 return False
@@ -164,23 +303,17 @@ class LayerGroup(BaseModel):
         Returns:
             True if child was found and moved, False otherwise
         """
-        if isinstance(child, str):  # ID string
-            for i, existing_child in enumerate(self.children):
-                if existing_child.id == child:
-                    child_obj = self.children.pop(i)
-                    new_index = max(0, min(new_index, len(self.children)))
-                    self.children.insert(new_index, child_obj)
-                    return True
-            return False
-        else:
-            try:
-                current_index = self.children.index(child)
-                child_obj = self.children.pop(current_index)
+        # Compare by id in both cases; list.index would fall back to
+        # pydantic model equality, which deep-compares whole subtrees
+        child_id = child if isinstance(child, str) else child.id
+        for i, existing_child in enumerate(self.children):
+            if existing_child.id == child_id:
+                child_obj = self.children.pop(i)
                 new_index = max(0, min(new_index, len(self.children)))
                 self.children.insert(new_index, child_obj)
+                self._notify_structure_changed()
                 return True
-            except ValueError:
-                return False
+        return False
     
     def get_all_layers(self, recursive: bool = True) -> List[Layer]:
         """
@@ -192,12 +325,22 @@ class LayerGroup(BaseModel):
         Returns:
             List of all Layer objects
         """
-        layers = []
-        for child in self.children:
-            if isinstance(child, Layer):
-                layers.append(child)
-            elif isinstance(child, LayerGroup) and recursive:
-                layers.extend(child.get_all_layers(recursive=True))
+        if not recursive:
+            return cast(
+                List[Layer],
+                [child for child in self.children if child._kind == 'layer'],
+            )
+
+        # Iterative DFS: avoids per-level list copies and recursion overhead
+        # while preserving depth-first, left-to-right order
+        layers: List[Layer] = []
+        stack: "deque[Union[LayerGroup, Layer]]" = deque(reversed(self.children))
+        while stack:
+            child = stack.pop()
+            if child._kind == 'layer':
+                layers.append(cast(Layer, child))
+            else:
+                stack.extend(reversed(cast('LayerGroup', child).children))
         return layers
     
     def get_all_shapes(self, recursive: bool = True) -> List[Union[Shape, ID]]:
@@ -215,6 +358,46 @@ class LayerGroup(BaseModel):
             shapes.extend(layer.shapes)
         return shapes
     
+    def get_bounds(self, recursive: bool = True) -> Optional[Bounds]:
+        """
+        Aggregate the bounds of all shapes in this group.
+
+        Runs one running min/max pass over each shape's memoized bounds,
+        so repeat calls on an unchanged group reduce already-cached floats
+        rather than re-deriving geometry.
+
+        Args:
+            recursive: If True, include shapes from nested groups
+
+        Returns:
+            Combined (min_x, min_y, max_x, max_y) box, or None if the
+            group holds no shapes with computable bounds
+        """
+        min_x = min_y = float('inf')
+        max_x = max_y = float('-inf')
+        found = False
+
+        for shape in self.get_all_shapes(recursive=recursive):
+            if not isinstance(shape, Shape):
+                continue  # bare IDs carry no geometry
+            bounds = shape.get_bounds()
+            if bounds is None:
+                continue
+            x1, y1, x2, y2 = bounds
+            if x1 < min_x:
+                min_x = x1
+            if y1 < min_y:
+                min_y = y1
+            if x2 > max_x:
+                max_x = x2
+            if y2 > max_y:
+                max_y = y2
+            found = True
+
+        if not found:
+            return None
+        return (min_x, min_y, max_x, max_y)
+
     def get_child_count(self) -> int:
         """Get the number of direct children in this group."""
         return len(self.children)
@@ -234,13 +417,14 @@ class LayerGroup(BaseModel):
         Returns:
             Layer object if found, None otherwise
         """
-        for child in self.children:
-            if isinstance(child, Layer) and child.id == layer_id:
-                return child
-            elif isinstance(child, LayerGroup) and recursive:
-                found = child.find_layer_by_id(layer_id, recursive=True)
-                if found:
-                    return found
+        stack: "deque[Union[LayerGroup, Layer]]" = deque(self.children)
+        while stack:
+            child = stack.pop()
+            if child._kind == 'layer':
+                if child.id == layer_id:
+                    return cast(Layer, child)
+            elif recursive:
+                stack.extend(cast('LayerGroup', child).children)
         return None
     
     def find_group_by_id(self, group_id: ID, recursive: bool = True) -> Optional['LayerGroup']:
@@ -256,15 +440,20 @@ class LayerGroup(BaseModel):
         """
         if self.id == group_id:
             return self
-        
-        for child in self.children:
-            if isinstance(child, LayerGroup):
-                if child.id == group_id:
-                    return child
-                elif recursive:
-                    found = child.find_group_by_id(group_id, recursive=True)
-                    if found:
-                        return found
+
+        stack: "deque[LayerGroup]" = deque(
+            cast('LayerGroup', child)
+            for child in self.children if child._kind == 'group'
+        )
+        while stack:
+            group = stack.pop()
+            if group.id == group_id:
+                return group
+            if recursive:
+                stack.extend(
+                    cast('LayerGroup', child)
+                    for child in group.children if child._kind == 'group'
+                )
         return None
 
 
@@ -285,7 +474,58 @@ class LayerManager(BaseModel):
     
     root_group: LayerGroup = Field(default_factory=lambda: LayerGroup(name="Root"), description="Root layer group")  # type: ignore
     active_layer_id: Optional[ID] = Field(None, description="Currently active layer ID")
-    
+
+    # Flat layer list cached until the tree structure changes; LayerGroup
+    # mutations invalidate it through the manager backref
+    _flat_layers_cache: Optional[List[Layer]] = PrivateAttr(default=None)
+    # Lazily built (id -> Layer, id -> LayerGroup, child id -> parent group)
+    # maps, rebuilt in one walk after structural changes
+    _id_index: Optional[Tuple[Dict[ID, Layer], Dict[ID, 'LayerGroup'], Dict[ID, 'LayerGroup']]] = PrivateAttr(default=None)
+    # Quadtree over shape bounds for viewport/hit-test queries; rebuilt on
+    # demand after structural changes
+    _spatial_index: Optional[SpatialIndex] = PrivateAttr(default=None)
+    # Memoized summary() tuple; layers invalidate it through their manager
+    # backref when shape counts or visibility change
+    _summary_cache: Optional[Tuple[int, int, int, List[str]]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Register this manager with its layer tree for cache invalidation."""
+        self.root_group._attach_manager(self)
+
+    def _invalidate_layer_cache(self) -> None:
+        """Drop cached layer views after a structural change."""
+        self._flat_layers_cache = None
+        self._id_index = None
+        self._spatial_index = None
+        self._summary_cache = None
+
+    def _invalidate_summary(self) -> None:
+        """Drop the cached summary after a per-layer content change."""
+        self._summary_cache = None
+
+    def _get_id_index(self) -> Tuple[Dict[ID, Layer], Dict[ID, 'LayerGroup'], Dict[ID, 'LayerGroup']]:
+        """Build (or reuse) the id lookup maps in a single traversal."""
+        index = self._id_index
+        if index is None:
+            layers_by_id: Dict[ID, Layer] = {}
+            groups_by_id: Dict[ID, LayerGroup] = {}
+            parent_of: Dict[ID, LayerGroup] = {}
+
+            stack: "deque[LayerGroup]" = deque([self.root_group])
+            while stack:
+                group = stack.pop()
+                groups_by_id[group.id] = group
+                for child in group.children:
+                    parent_of[child.id] = group
+                    if child._kind == 'layer':
+                        layers_by_id[child.id] = cast(Layer, child)
+                    else:
+                        stack.append(cast('LayerGroup', child))
+
+            index = (layers_by_id, groups_by_id, parent_of)
+            self._id_index = index
+        return index
+
     def create_layer(self, name: str, parent_group: Optional[LayerGroup] = None) -> Layer:
         """
         Create a new layer.
@@ -375,21 +615,47 @@ class LayerManager(BaseModel):
         return False
     
     def get_all_layers(self) -> List[Layer]:
-        """Get all layers in the document."""
-        return self.root_group.get_all_layers(recursive=True)
-    
+        """
+        Get all layers in the document.
+
+        The returned list is cached until the layer tree changes; treat it
+        as read-only.
+        """
+        layers = self._flat_layers_cache
+        if layers is None:
+            layers = self.root_group.get_all_layers(recursive=True)
+            self._flat_layers_cache = layers
+        return layers
+
     def get_layers_by_z_order(self) -> List[Layer]:
         """Get all layers sorted by z-index (back to front)."""
+        # Sort per call: z_index assignments do not notify the manager,
+        # only structural changes do
         layers = self.get_all_layers()
-        return sorted(layers, key=lambda layer: layer.z_index)
+        if len(layers) < 2:
+            return list(layers)
+
+        min_z = min(layer.z_index for layer in layers)
+        max_z = max(layer.z_index for layer in layers)
+
+        # z-indexes usually span a small range, so a stable counting sort
+        # (O(n + k)) beats Timsort; degenerate ranges fall back to sorted
+        span = max_z - min_z
+        if span < len(layers):
+            buckets: List[List[Layer]] = [[] for _ in range(span + 1)]
+            for layer in layers:
+                buckets[layer.z_index - min_z].append(layer)
+            return list(chain.from_iterable(buckets))
+
+        return sorted(layers, key=_zkey)
     
     def find_layer_by_id(self, layer_id: ID) -> Optional[Layer]:
-        """Find a layer by ID."""
-        return self.root_group.find_layer_by_id(layer_id, recursive=True)
-    
+        """Find a layer by ID (O(1) via the id index)."""
+        return self._get_id_index()[0].get(layer_id)
+
     def find_group_by_id(self, group_id: ID) -> Optional[LayerGroup]:
-        """Find a group by ID."""
-        return self.root_group.find_group_by_id(group_id, recursive=True)
+        """Find a group by ID (O(1) via the id index)."""
+        return self._get_id_index()[1].get(group_id)
     
     def set_active_layer(self, layer_id: ID) -> bool:
         """
@@ -414,35 +680,128 @@ class LayerManager(BaseModel):
     
     def reorder_layers_by_z_index(self) -> None:
         """Reorder all layers within their groups based on z_index."""
-        def sort_group(group: LayerGroup) -> None:
-            # Sort children by z_index
-            group.children.sort(key=lambda child: child.z_index)
-            
-            # Recursively sort nested groups
-            for child in group.children:
-                if isinstance(child, LayerGroup):
-                    sort_group(child)
-        
-        sort_group(self.root_group)
+        changed = False
+        stack: "deque[LayerGroup]" = deque([self.root_group])
+        while stack:
+            group = stack.pop()
+            children = group.children
+            # Skip already-sorted groups (the common case on repeat calls):
+            # the O(n) order check is cheaper than an unconditional sort
+            if any(
+                _zkey(a) > _zkey(b)
+                for a, b in zip(children, islice(children, 1, None))
+            ):
+                children.sort(key=_zkey)
+                changed = True
+            stack.extend(
+                cast('LayerGroup', child)
+                for child in children if child._kind == 'group'
+            )
+
+        if changed:
+            # children.sort bypasses add_child/remove_child, so invalidate directly
+            self._invalidate_layer_cache()
     
     def _find_parent_group(self, child_id: ID) -> Optional[LayerGroup]:
-        """Find the parent group of a layer or group by child ID."""
-        def search_group(group: LayerGroup) -> Optional[LayerGroup]:
-            for child in group.children:
-                if child.id == child_id:
-                    return group
-                elif isinstance(child, LayerGroup):
-                    found = search_group(child)
-                    if found:
-                        return found
-            return None
-        
-        return search_group(self.root_group)
+        """Find the parent group of a layer or group by child ID (O(1))."""
+        return self._get_id_index()[2].get(child_id)
     
     def get_layer_count(self) -> int:
         """Get total number of layers."""
         return len(self.get_all_layers())
+
+    def iter_empty_layers(self) -> Iterator[Layer]:
+        """Yield layers that contain no shapes, in traversal order."""
+        for layer in self.get_all_layers():
+            if not layer.shapes:
+                yield layer
+
+    def summary(self) -> Tuple[int, int, int, List[str]]:
+        """
+        Collect layer statistics in a single traversal.
+
+        The result is memoized: layers report shape and visibility changes
+        through their manager backref, so a read-only stretch of calls
+        (e.g. get_document_info followed by validate_document) pays for
+        one traversal rather than one per call.
+
+        Returns:
+            Tuple of (layer_count, shape_count, visible_count, empty_layer_names)
+        """
+        cached = self._summary_cache
+        if cached is not None:
+            return (cached[0], cached[1], cached[2], list(cached[3]))
+
+        layer_count = 0
+        shape_count = 0
+        visible_count = 0
+        empty_layer_names = []
+
+        for layer in self.get_all_layers():
+            layer_count += 1
+            layer_shapes = layer.get_shape_count()
+            shape_count += layer_shapes
+            if layer.visible:
+                visible_count += 1
+            if layer_shapes == 0:
+                empty_layer_names.append(layer.name)
+
+        self._summary_cache = (layer_count, shape_count, visible_count, empty_layer_names)
+        return (layer_count, shape_count, visible_count, list(empty_layer_names))
     
+    def get_all_shape_bounds(self) -> List[Tuple[ID, Optional[Bounds]]]:
+        """
+        Collect bounds for every Shape in the document in one pass.
+
+        Uses the cached flat layer list and each shape's memoized bounds,
+        so repeat calls over an unchanged scene avoid both the tree walk
+        and the per-shape geometry math.
+
+        Returns:
+            List of (shape_id, bounds) pairs in traversal order; bounds is
+            None for shapes whose type has no bounds implementation
+        """
+        return [
+            (shape.id, shape.get_bounds())
+            for layer in self.get_all_layers()
+            for shape in layer.shapes
+            if isinstance(shape, Shape)
+        ]
+
+    def get_spatial_index(self) -> SpatialIndex:
+        """
+        Get (or build) the spatial index over all shapes in the document.
+
+        The index covers Shape objects only (ID references have no bounds)
+        and is cached until the layer tree changes. Shape-level edits such
+        as ``Layer.add_shape`` or transform changes do not notify the
+        manager; call ``rebuild_spatial_index`` after them.
+        """
+        index = self._spatial_index
+        if index is None:
+            shapes = [
+                shape
+                for layer in self.get_all_layers()
+                for shape in layer.shapes
+                if isinstance(shape, Shape)
+            ]
+            index = SpatialIndex(shapes)
+            self._spatial_index = index
+        return index
+
+    def rebuild_spatial_index(self) -> SpatialIndex:
+        """Force a rebuild of the spatial index and return the fresh one."""
+        self._spatial_index = None
+        return self.get_spatial_index()
+
+    def query_bounds(self, bounds: Bounds) -> List[Shape]:
+        """Find shapes whose bounds intersect a (min_x, min_y, max_x, max_y) box."""
+        return self.get_spatial_index().query_bounds(bounds)
+
+    def query_point(self, x: float, y: float, margin: float = 0.0) -> List[Shape]:
+        """Find shapes whose bounds contain a point, with optional margin."""
+        return self.get_spatial_index().query_point(x, y, margin)
+
     def get_visible_layers(self) -> List[Layer]:
         """Get all visible layers."""
         return [layer for layer in self.get_all_layers() if layer.visible]
@@ -2,16 +2,137 @@
 Shape models implementing component-based design pattern.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Union
-from pydantic import BaseModel, Field, model_validator
+import pickle
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
+from weakref import WeakValueDictionary
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, model_validator
 
 from .types import ShapeType, ID, Coordinate, InvalidGeometryError, generate_id
 from .styles import FillProperties, StrokeProperties, Effects
 
 
+@dataclass(frozen=True, slots=True)
+class RectangleGeometry:
+    """Typed rectangle geometry."""
+
+    width: float
+    height: float
+    corner_radius: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class CircleGeometry:
+    """Typed circle geometry."""
+
+    radius: float
+
+
+@dataclass(frozen=True, slots=True)
+class EllipseGeometry:
+    """Typed ellipse geometry."""
+
+    rx: float
+    ry: float
+
+
+@dataclass(frozen=True, slots=True)
+class LineGeometry:
+    """Typed line geometry."""
+
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+
+
+@dataclass(frozen=True, slots=True)
+class PolylineGeometry:
+    """Typed polyline geometry."""
+
+    points: Tuple[Tuple[float, float], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PolygonGeometry:
+    """Typed polygon geometry."""
+
+    points: Tuple[Tuple[float, float], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PathGeometry:
+    """Typed path geometry."""
+
+    path_data: str
+
+
+@dataclass(frozen=True, slots=True)
+class GroupGeometry:
+    """Typed group geometry."""
+
+    children: Tuple[ID, ...]
+
+
+Geometry = Union[
+    RectangleGeometry, CircleGeometry, EllipseGeometry, LineGeometry,
+    PolylineGeometry, PolygonGeometry, PathGeometry, GroupGeometry
+]
+
+
+# Builders from the validated geometry dict to the slotted typed form
+_TYPED_GEOMETRY_BUILDERS: Dict[ShapeType, Callable[[Dict[str, Any]], Geometry]] = {
+    ShapeType.RECTANGLE: lambda g: RectangleGeometry(
+        g['width'], g['height'], g.get('corner_radius', 0.0)
+    ),
+    ShapeType.CIRCLE: lambda g: CircleGeometry(g['radius']),
+    ShapeType.ELLIPSE: lambda g: EllipseGeometry(g['rx'], g['ry']),
+    ShapeType.LINE: lambda g: LineGeometry(g['x1'], g['y1'], g['x2'], g['y2']),
+    ShapeType.POLYLINE: lambda g: PolylineGeometry(
+        tuple((p[0], p[1]) for p in g['points'])
+    ),
+    ShapeType.POLYGON: lambda g: PolygonGeometry(
+        tuple((p[0], p[1]) for p in g['points'])
+    ),
+    ShapeType.PATH: lambda g: PathGeometry(g['path_data']),
+    ShapeType.GROUP: lambda g: GroupGeometry(tuple(g['children'])),
+}
+
+
+# Pool of shared Transform/StyleProperties instances keyed by class name
+# and dumped field values. Weak values let unused entries be collected.
+_intern_pool: "WeakValueDictionary[Tuple[str, bytes], BaseModel]" = WeakValueDictionary()
+
+
+_ModelT = TypeVar('_ModelT', bound=BaseModel)
+
+
+def _intern(instance: _ModelT) -> _ModelT:
+    """Return a pooled instance with identical field values, if one exists."""
+    key = (
+        type(instance).__name__,
+        pickle.dumps(instance.model_dump(mode='python'), protocol=5),
+    )
+    pooled = _intern_pool.get(key)
+    if pooled is not None:
+        # The pool is keyed by class name, so the hit has instance's type
+        return cast(_ModelT, pooled)
+    _intern_pool[key] = instance
+    return instance
+
+
 class Transform(BaseModel):
-    """Geometric transformation properties."""
-    
+    """
+    Geometric transformation properties.
+
+    Frozen: instances are shared freely (intern pool, default singleton,
+    translate-only fast path), so a shape's transform is replaced, never
+    mutated in place. Use model_copy(update={...}) to derive a variant.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
     x: float = Field(0.0, description="X position")
     y: float = Field(0.0, description="Y position")
     rotation: float = Field(0.0, description="Rotation in degrees")
@@ -20,14 +141,68 @@ class Transform(BaseModel):
     skew_x: float = Field(0.0, description="X skew in degrees")
     skew_y: float = Field(0.0, description="Y skew in degrees")
 
+    @classmethod
+    def intern(cls, **kwargs: Any) -> 'Transform':
+        """
+        Build a Transform, sharing one instance per distinct field values.
+
+        Interned instances may be aliased across many shapes; treat them
+        as immutable and assign a fresh Transform to change a shape.
+        """
+        return _intern(cls(**kwargs))
+
+    @classmethod
+    def translate(cls, x: float, y: float) -> 'Transform':
+        """
+        Build a translate-only Transform, skipping validation.
+
+        Nearly every transform in practice sets just x and y; this fast
+        path is two field stores plus defaults instead of validating all
+        seven fields. Coordinates must be trusted floats.
+        """
+        return cls.model_construct(x=x, y=y)
+
 
 class StyleProperties(BaseModel):
-    """Combined styling properties for shapes."""
-    
+    """
+    Combined styling properties for shapes.
+
+    Frozen for the same reason as Transform: default-styled shapes alias
+    one shared instance, so restyling means assigning a fresh object.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
     fill: Optional[FillProperties] = Field(None, description="Fill properties")
     stroke: Optional[StrokeProperties] = Field(None, description="Stroke properties")
     effects: Optional[Effects] = Field(None, description="Visual effects")
 
+    @classmethod
+    def intern(cls, **kwargs: Any) -> 'StyleProperties':
+        """
+        Build a StyleProperties, sharing one instance per distinct values.
+
+        Interned instances may be aliased across many shapes; treat them
+        as immutable and assign fresh StyleProperties to restyle a shape.
+        """
+        return _intern(cls(**kwargs))
+
+
+# Default sub-model singletons, pre-seeded into the intern pool. The
+# module-level references keep them alive in the weak-valued pool, and
+# validate_geometry assigns them directly instead of constructing (and
+# immediately discarding) a fresh instance per default-styled shape.
+_DEFAULT_TRANSFORM: Transform = _intern(Transform())  # type: ignore
+_DEFAULT_STYLE: StyleProperties = _intern(StyleProperties())  # type: ignore
+
+
+# Required-field and command sets used by the geometry validators,
+# hoisted to module scope so hot validation paths do not rebuild them
+_RECT_REQUIRED = frozenset(('width', 'height'))
+_ELLIPSE_REQUIRED = frozenset(('rx', 'ry'))
+_LINE_REQUIRED = frozenset(('x1', 'y1', 'x2', 'y2'))
+_SVG_PATH_COMMANDS = frozenset('MmLlHhVvCcSsQqTtAaZz')
+
 
 class Shape(BaseModel):
     """
@@ -45,44 +220,76 @@ class Shape(BaseModel):
     visible: bool = Field(True, description="Shape visibility")
     locked: bool = Field(False, description="Shape editing lock")
     name: Optional[str] = Field(None, description="Optional shape name")
-    
+
+    # Lazily built slotted view of the geometry dict; assumes geometry is
+    # not mutated in place after validation
+    _typed_geometry: Optional[Geometry] = PrivateAttr(default=None)
+    # Memoized get_bounds result; None means not yet computed (or invalidated).
+    # A separate flag distinguishes "uncached" from a legitimate None result.
+    _cached_bounds: Optional[Tuple[float, float, float, float]] = PrivateAttr(default=None)
+    _bounds_valid: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Invalidate cached derived data when geometry-affecting fields change."""
+        super().__setattr__(name, value)
+        if name in ('geometry', 'transform', 'type'):
+            self._typed_geometry = None
+            self._cached_bounds = None
+            self._bounds_valid = False
+
+    @property
+    def typed_geometry(self) -> Geometry:
+        """
+        Typed, slotted view of the geometry dict.
+
+        Built once on first access; attribute access on the dataclass is
+        cheaper than repeated dict lookups in bounds/render hot paths.
+        """
+        cached = self._typed_geometry
+        if cached is None:
+            cached = _TYPED_GEOMETRY_BUILDERS[self.type](self.geometry)
+            self._typed_geometry = cached
+        return cached
+
     @model_validator(mode='after')
     def validate_geometry(self) -> 'Shape':
         """Validate geometry data matches shape type requirements."""
-        # Initialize defaults if None
+        # Initialize defaults if None; defaults dominate bulk documents,
+        # so share the interned singletons with zero per-shape allocations
         if self.style is None:
-            self.style = StyleProperties()  # type: ignore
+            self.style = _DEFAULT_STYLE
         if self.transform is None:
-            self.transform = Transform()  # type: ignore
-        geometry = self.geometry
-        shape_type = self.type
-        
-        if shape_type == ShapeType.RECTANGLE:
-            self._validate_rectangle_geometry(geometry)
-        elif shape_type == ShapeType.CIRCLE:
-            self._validate_circle_geometry(geometry)
-        elif shape_type == ShapeType.ELLIPSE:
-            self._validate_ellipse_geometry(geometry)
-        elif shape_type == ShapeType.LINE:
-            self._validate_line_geometry(geometry)
-        elif shape_type == ShapeType.POLYLINE:
-            self._validate_polyline_geometry(geometry)
-        elif shape_type == ShapeType.POLYGON:
-            self._validate_polygon_geometry(geometry)
-        elif shape_type == ShapeType.PATH:
-            self._validate_path_geometry(geometry)
-        elif shape_type == ShapeType.GROUP:
-            self._validate_group_geometry(geometry)
-        else:
-            raise InvalidGeometryError(f"Unknown shape type: {shape_type}")
-        
+            self.transform = _DEFAULT_TRANSFORM
+
+        # Identical geometry dicts repeat heavily in bulk loads (default
+        # shapes, copy/paste); skip re-validating one we have already seen.
+        # Geometries with unhashable values (point lists) fall through.
+        try:
+            cache_key = (self.type, tuple(sorted(self.geometry.items())))
+            if cache_key in _VALIDATED_GEOMETRIES:
+                _VALIDATED_GEOMETRIES.move_to_end(cache_key)
+                return self
+        except TypeError:
+            cache_key = None
+
+        # Constant-time dispatch; shapes are constructed in bulk during
+        # deserialization, so the if/elif chain over ShapeType adds up
+        validator = _GEOMETRY_VALIDATORS.get(self.type)
+        if validator is None:
+            raise InvalidGeometryError(f"Unknown shape type: {self.type}")
+        validator(self, self.geometry)
+
+        if cache_key is not None:
+            _VALIDATED_GEOMETRIES[cache_key] = None
+            if len(_VALIDATED_GEOMETRIES) > _VALIDATED_GEOMETRIES_MAX:
+                _VALIDATED_GEOMETRIES.popitem(last=False)
+
         return self
     
     def _validate_rectangle_geometry(self, geometry: Dict[str, Any]) -> None:
         """Validate rectangle geometry: requires width and height."""
-        required_fields = {'width', 'height'}
-        if not required_fields.issubset(geometry.keys()):
-            raise InvalidGeometryError(f"Rectangle requires: {required_fields}")
+        if not _RECT_REQUIRED.issubset(geometry.keys()):
+            raise InvalidGeometryError(f"Rectangle requires: {set(_RECT_REQUIRED)}")
         
         width = geometry.get('width')
         height = geometry.get('height')
@@ -109,9 +316,8 @@ class Shape(BaseModel):
     
     def _validate_ellipse_geometry(self, geometry: Dict[str, Any]) -> None:
         """Validate ellipse geometry: requires rx and ry."""
-        required_fields = {'rx', 'ry'}
-        if not required_fields.issubset(geometry.keys()):
-            raise InvalidGeometryError(f"Ellipse requires: {required_fields}")
+        if not _ELLIPSE_REQUIRED.issubset(geometry.keys()):
+            raise InvalidGeometryError(f"Ellipse requires: {set(_ELLIPSE_REQUIRED)}")
         
         rx = geometry['rx']
         ry = geometry['ry']
@@ -123,44 +329,42 @@ class Shape(BaseModel):
     
     def _validate_line_geometry(self, geometry: Dict[str, Any]) -> None:
         """Validate line geometry: requires start and end points."""
-        required_fields = {'x1', 'y1', 'x2', 'y2'}
-        if not required_fields.issubset(geometry.keys()):
-            raise InvalidGeometryError(f"Line requires: {required_fields}")
-        
-        for field in required_fields:
+        if not _LINE_REQUIRED.issubset(geometry.keys()):
+            raise InvalidGeometryError(f"Line requires: {set(_LINE_REQUIRED)}")
+
+        for field in _LINE_REQUIRED:
             value = geometry[field]
             if not isinstance(value, (int, float)):
                 raise InvalidGeometryError(f"Line {field} must be a number")
     
-    def _validate_polyline_geometry(self, geometry: Dict[str, Any]) -> None:
-        """Validate polyline geometry: requires points array."""
-        if 'points' not in geometry:
-            raise InvalidGeometryError("Polyline requires points array")
-        
-        points = geometry['points']
-        if not isinstance(points, list) or len(points) < 2:
-            raise InvalidGeometryError("Polyline must have at least 2 points")
-        
+    @staticmethod
+    def _validate_points(points: Any, min_points: int, shape_name: str) -> None:
+        """Validate a point array in one tight pass."""
+        # Tuples are accepted alongside lists so callers can pass
+        # immutable (and hashable, hence LRU-cacheable) point data
+        if not isinstance(points, (list, tuple)) or len(points) < min_points:
+            raise InvalidGeometryError(f"{shape_name} must have at least {min_points} points")
+
         for i, point in enumerate(points):
             if not isinstance(point, (list, tuple)) or len(point) != 2:
                 raise InvalidGeometryError(f"Point {i} must be [x, y] coordinate")
-            if not all(isinstance(coord, (int, float)) for coord in point):
+            x, y = point
+            if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
                 raise InvalidGeometryError(f"Point {i} coordinates must be numbers")
-    
+
+    def _validate_polyline_geometry(self, geometry: Dict[str, Any]) -> None:
+        """Validate polyline geometry: requires points array."""
+        if 'points' not in geometry:
+            raise InvalidGeometryError("Polyline requires points array")
+
+        self._validate_points(geometry['points'], 2, "Polyline")
+
     def _validate_polygon_geometry(self, geometry: Dict[str, Any]) -> None:
         """Validate polygon geometry: requires points array (closed shape)."""
         if 'points' not in geometry:
             raise InvalidGeometryError("Polygon requires points array")
-        
-        points = geometry['points']
-        if not isinstance(points, list) or len(points) < 3:
-            raise InvalidGeometryError("Polygon must have at least 3 points")
-        
-        for i, point in enumerate(points):
-            if not isinstance(point, (list, tuple)) or len(point) != 2:
-                raise InvalidGeometryError(f"Point {i} must be [x, y] coordinate")
-            if not all(isinstance(coord, (int, float)) for coord in point):
-                raise InvalidGeometryError(f"Point {i} coordinates must be numbers")
+
+        self._validate_points(geometry['points'], 3, "Polygon")
     
     def _validate_path_geometry(self, geometry: Dict[str, Any]) -> None:
         """Validate path geometry: requires path_data string."""
@@ -172,9 +376,8 @@ class Shape(BaseModel):
             raise InvalidGeometryError("Path data must be a non-empty string")
         
         # Basic SVG path validation - starts with valid command
-        valid_commands = {'M', 'm', 'L', 'l', 'H', 'h', 'V', 'v', 'C', 'c', 'S', 's', 'Q', 'q', 'T', 't', 'A', 'a', 'Z', 'z'}
         first_char = path_data.strip()[0]
-        if first_char not in valid_commands:
+        if first_char not in _SVG_PATH_COMMANDS:
             raise InvalidGeometryError("Path data must start with a valid SVG path command")
     
     def _validate_group_geometry(self, geometry: Dict[str, Any]) -> None:
@@ -191,63 +394,138 @@ class Shape(BaseModel):
             if not isinstance(child, str):
                 raise InvalidGeometryError(f"Child {i} must be a shape ID string")
     
+    @classmethod
+    def fast(cls, **kwargs: Any) -> 'Shape':
+        """
+        Build a Shape from trusted data, skipping validation.
+
+        For bulk builders whose geometry and styles are literal or
+        already validated; missing style/transform default to the shared
+        interned singletons exactly as validation would assign them.
+        Untrusted input should go through Shape(...) instead. See
+        make_rgb for the trust contract.
+        """
+        kwargs.setdefault('style', _DEFAULT_STYLE)
+        kwargs.setdefault('transform', _DEFAULT_TRANSFORM)
+        return cls.model_construct(**kwargs)
+
+    @classmethod
+    def load_many(cls, data: Union[bytes, str]) -> List['Shape']:
+        """
+        Deserialize a JSON array of shapes in one pass.
+
+        Uses a precompiled TypeAdapter, so bulk reloads avoid the
+        per-call overhead of validating shapes one by one.
+
+        Args:
+            data: JSON bytes or string encoding a list of shapes
+
+        Returns:
+            List of validated Shape objects
+        """
+        return _SHAPE_LIST_ADAPTER.validate_json(data)
+
+    @classmethod
+    def validate_many(cls, specs: List[Dict[str, Any]]) -> List['Shape']:
+        """
+        Validate a list of plain shape dicts in one pass.
+
+        The dict-literal counterpart to load_many: one pydantic-core
+        schema traversal for the whole batch instead of one Shape(...)
+        call per spec.
+        """
+        return _SHAPE_LIST_ADAPTER.validate_python(specs)
+
     def get_bounds(self) -> Optional[Tuple[float, float, float, float]]:
         """
         Calculate bounding box for the shape.
         
         Returns:
             Tuple of (min_x, min_y, max_x, max_y) or None if bounds cannot be calculated
+
+        Note:
+            The result is cached; replacing `geometry`, `transform`, or
+            `type` invalidates it, but in-place mutation of the geometry
+            dict or transform fields does not.
         """
-        geometry = self.geometry
-        transform = self.transform or Transform()  # type: ignore
-        
+        if self._bounds_valid:
+            return self._cached_bounds
+
+        bounds: Optional[Tuple[float, float, float, float]] = None
+
         # Calculate base bounds without transform
         base_bounds = self._calculate_base_bounds()
-        if not base_bounds:
-            return None
-        
-        min_x, min_y, max_x, max_y = base_bounds
-        
-        # Apply transform (simplified - only position for now)
-        min_x += transform.x
-        min_y += transform.y
-        max_x += transform.x
-        max_y += transform.y
-        
-        return (min_x, min_y, max_x, max_y)
+        if base_bounds:
+            min_x, min_y, max_x, max_y = base_bounds
+
+            # Apply transform (simplified - only position for now)
+            transform = self.transform or Transform()  # type: ignore
+            min_x += transform.x
+            min_y += transform.y
+            max_x += transform.x
+            max_y += transform.y
+
+            bounds = (min_x, min_y, max_x, max_y)
+
+        self._cached_bounds = bounds
+        self._bounds_valid = True
+        return bounds
     
     def _calculate_base_bounds(self) -> Optional[Tuple[float, float, float, float]]:
         """Calculate bounding box without transforms."""
-        geometry = self.geometry
-        
-        if self.type == ShapeType.RECTANGLE:
-            width = geometry['width']
-            height = geometry['height']
-            return (0.0, 0.0, width, height)
-        
-        elif self.type == ShapeType.CIRCLE:
-            radius = geometry['radius']
+        geom = self.typed_geometry
+
+        if isinstance(geom, RectangleGeometry):
+            return (0.0, 0.0, geom.width, geom.height)
+
+        elif isinstance(geom, CircleGeometry):
+            radius = geom.radius
             return (-radius, -radius, radius, radius)
-        
-        elif self.type == ShapeType.ELLIPSE:
-            rx = geometry['rx']
-            ry = geometry['ry']
-            return (-rx, -ry, rx, ry)
-        
-        elif self.type == ShapeType.LINE:
-            x1, y1, x2, y2 = geometry['x1'], geometry['y1'], geometry['x2'], geometry['y2']
+
+        elif isinstance(geom, EllipseGeometry):
+            return (-geom.rx, -geom.ry, geom.rx, geom.ry)
+
+        elif isinstance(geom, LineGeometry):
+            x1, y1, x2, y2 = geom.x1, geom.y1, geom.x2, geom.y2
             min_x, max_x = min(x1, x2), max(x1, x2)
             min_y, max_y = min(y1, y2), max(y1, y2)
             return (min_x, min_y, max_x, max_y)
-        
-        elif self.type in (ShapeType.POLYLINE, ShapeType.POLYGON):
-            points = geometry['points']
+
+        elif isinstance(geom, (PolylineGeometry, PolygonGeometry)):
+            points = geom.points
             if not points:
                 return None
-            
-            xs = [point[0] for point in points]
-            ys = [point[1] for point in points]
+
+            # Transpose once at C level rather than two list comprehensions
+            xs, ys = zip(*points)
             return (min(xs), min(ys), max(xs), max(ys))
-        
+
         # PATH and GROUP bounds are more complex and would need additional implementation
-        return None
\ No newline at end of file
+        return None
+
+
+# LRU of geometry dicts that already passed validation, keyed by
+# (shape type, sorted items). Pydantic v2 resolves field/validator
+# metadata once per class, so the repeated per-instance cost left is our
+# own geometry validators; this skips them for duplicate geometries.
+_VALIDATED_GEOMETRIES_MAX = 512
+_VALIDATED_GEOMETRIES: "OrderedDict[Tuple[ShapeType, Tuple[Tuple[str, Any], ...]], None]" = OrderedDict()
+
+
+# Precompiled adapter for bulk shape loads; built once so load_many
+# avoids per-call schema resolution
+_SHAPE_LIST_ADAPTER: TypeAdapter[List[Shape]] = TypeAdapter(List[Shape])
+
+
+# Geometry validator dispatch table, built once after class creation so
+# validate_geometry resolves the handler with a single dict lookup
+_GEOMETRY_VALIDATORS: Dict[ShapeType, Callable[[Shape, Dict[str, Any]], None]] = {
+    ShapeType.RECTANGLE: Shape._validate_rectangle_geometry,
+    ShapeType.CIRCLE: Shape._validate_circle_geometry,
+    ShapeType.ELLIPSE: Shape._validate_ellipse_geometry,
+    ShapeType.LINE: Shape._validate_line_geometry,
+    ShapeType.POLYLINE: Shape._validate_polyline_geometry,
+    ShapeType.POLYGON: Shape._validate_polygon_geometry,
+    ShapeType.PATH: Shape._validate_path_geometry,
+    ShapeType.GROUP: Shape._validate_group_geometry,
+}
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""Structure-of-arrays shape storage for render-only workloads."""
+
+from array import array
+from typing import Iterator, Sequence, Tuple
+
+# Small integer codes for the column-stored shape kinds
+RECT = 0
+CIRCLE = 1
+ELLIPSE = 2
+LINE = 3
+
+_RGBA = Tuple[int, int, int, int]
+_Row = Tuple[int, float, float, Tuple[float, float, float], _RGBA, _RGBA, float]
+
+# Coordinates are stored as Q24.8 fixed point: int32 columns at half the
+# width of float64, with 1/256 px resolution over a +/-8M px range
+_COORD_SCALE = 256.0
+
+
+class SoALayer:
+    """
+    Column-oriented shape storage for export and render pipelines.
+
+    Instead of a list of Shape models (one object graph per shape), each
+    attribute lives in its own compact typed column, so a traversal that
+    only reads positions or only reads colors walks a few contiguous
+    buffers. This is a write-once sink: entries cannot be edited after
+    append and do not serialize back into a document — workflows that
+    need editing or persistence should use Layer instead.
+
+    Colors are quantized to uint8 RGBA and coordinates to Q24.8 fixed
+    point (1/256 px), which loses nothing visible at canvas scale while
+    halving the bandwidth of an export traversal.
+
+    Geometry params by kind: RECT (width, height, corner_radius),
+    CIRCLE (radius,), ELLIPSE (rx, ry), LINE (x2, y2) with the first
+    endpoint at (tx, ty).
+    """
+
+    __slots__ = (
+        'name', '_kinds', '_tx', '_ty', '_p0', '_p1', '_p2',
+        '_fill', '_stroke', '_stroke_w',
+    )
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._kinds = array('b')
+        self._tx = array('i')
+        self._ty = array('i')
+        self._p0 = array('i')
+        self._p1 = array('i')
+        self._p2 = array('i')
+        # Flat N*4 RGBA bytes; alpha 0 means "no paint" for that slot
+        self._fill = array('B')
+        self._stroke = array('B')
+        self._stroke_w = array('f')
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def append(self, kind: int, tx: float, ty: float,
+               params: Sequence[float] = (),
+               fill_rgba: _RGBA = (0, 0, 0, 0),
+               stroke_rgba: _RGBA = (0, 0, 0, 0),
+               stroke_width: float = 1.0) -> None:
+        """Append one shape row across all columns."""
+        scale = _COORD_SCALE
+        self._kinds.append(kind)
+        self._tx.append(round(tx * scale))
+        self._ty.append(round(ty * scale))
+        p0, p1, p2 = (tuple(params) + (0.0, 0.0, 0.0))[:3]
+        self._p0.append(round(p0 * scale))
+        self._p1.append(round(p1 * scale))
+        self._p2.append(round(p2 * scale))
+        self._fill.extend(fill_rgba)
+        self._stroke.extend(stroke_rgba)
+        self._stroke_w.append(stroke_width)
+
+    def rows(self) -> Iterator[_Row]:
+        """Yield (kind, tx, ty, params, fill_rgba, stroke_rgba, stroke_w)."""
+        fill = self._fill
+        stroke = self._stroke
+        inv = 1.0 / _COORD_SCALE
+        for i, kind in enumerate(self._kinds):
+            c = i * 4
+            yield (
+                kind, self._tx[i] * inv, self._ty[i] * inv,
+                (self._p0[i] * inv, self._p1[i] * inv, self._p2[i] * inv),
+                (fill[c], fill[c + 1], fill[c + 2], fill[c + 3]),
+                (stroke[c], stroke[c + 1], stroke[c + 2], stroke[c + 3]),
+                self._stroke_w[i],
+            )
@@ -0,0 +1,158 @@
+"""
+Spatial indexing for fast viewport and hit-test queries over shapes.
+
+Provides a pure-Python quadtree so callers can find the shapes that
+intersect a rectangle or point in O(log n) instead of scanning every
+shape in the document.
+"""
+
+from typing import List, Optional, Tuple
+
+from .shapes import Shape
+
+Bounds = Tuple[float, float, float, float]  # (min_x, min_y, max_x, max_y)
+
+# Node capacity / depth limits; small nodes split, deep nodes stop splitting
+_MAX_ITEMS_PER_NODE = 10
+_MAX_DEPTH = 8
+
+
+def _intersects(a: Bounds, b: Bounds) -> bool:
+    """Check whether two (min_x, min_y, max_x, max_y) boxes overlap."""
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+class _QuadNode:
+    """Single quadtree node holding (bounds, shape) entries or four children."""
+
+    __slots__ = ("bounds", "depth", "items", "children")
+
+    def __init__(self, bounds: Bounds, depth: int) -> None:
+        self.bounds = bounds
+        self.depth = depth
+        self.items: List[Tuple[Bounds, Shape]] = []
+        self.children: Optional[List["_QuadNode"]] = None
+
+    def insert(self, item_bounds: Bounds, shape: Shape) -> None:
+        if self.children is not None:
+            child = self._child_containing(item_bounds)
+            if child is not None:
+                child.insert(item_bounds, shape)
+                return
+            # Straddles the split lines; keep at this level
+            self.items.append((item_bounds, shape))
+            return
+
+        self.items.append((item_bounds, shape))
+        if len(self.items) > _MAX_ITEMS_PER_NODE and self.depth < _MAX_DEPTH:
+            self._split()
+
+    def _split(self) -> None:
+        min_x, min_y, max_x, max_y = self.bounds
+        mid_x = (min_x + max_x) / 2
+        mid_y = (min_y + max_y) / 2
+        depth = self.depth + 1
+        self.children = [
+            _QuadNode((min_x, min_y, mid_x, mid_y), depth),
+            _QuadNode((mid_x, min_y, max_x, mid_y), depth),
+            _QuadNode((min_x, mid_y, mid_x, max_y), depth),
+            _QuadNode((mid_x, mid_y, max_x, max_y), depth),
+        ]
+
+        # Re-distribute items; entries that straddle a split line stay here
+        straddlers: List[Tuple[Bounds, Shape]] = []
+        for item_bounds, shape in self.items:
+            child = self._child_containing(item_bounds)
+            if child is not None:
+                child.insert(item_bounds, shape)
+            else:
+                straddlers.append((item_bounds, shape))
+        self.items = straddlers
+
+    def _child_containing(self, item_bounds: Bounds) -> Optional["_QuadNode"]:
+        assert self.children is not None
+        for child in self.children:
+            cb = child.bounds
+            if (
+                item_bounds[0] >= cb[0]
+                and item_bounds[1] >= cb[1]
+                and item_bounds[2] <= cb[2]
+                and item_bounds[3] <= cb[3]
+            ):
+                return child
+        return None
+
+    def query(self, query_bounds: Bounds, results: List[Shape]) -> None:
+        if not _intersects(self.bounds, query_bounds):
+            return
+        for item_bounds, shape in self.items:
+            if _intersects(item_bounds, query_bounds):
+                results.append(shape)
+        if self.children is not None:
+            for child in self.children:
+                child.query(query_bounds, results)
+
+
+class SpatialIndex:
+    """
+    Quadtree index over shapes keyed by their axis-aligned bounds.
+
+    Build once from a shape collection, then query by rectangle or point.
+    The index is a snapshot: shapes added or transformed after construction
+    are not reflected until the index is rebuilt. Shapes whose bounds
+    cannot be computed (paths, groups) are excluded from the index.
+    """
+
+    def __init__(self, shapes: List[Shape]) -> None:
+        # Shapes without computable bounds (paths, groups) cannot be
+        # indexed and are skipped rather than crashing the build
+        entries = []
+        for shape in shapes:
+            shape_bounds = shape.get_bounds()
+            if shape_bounds is not None:
+                entries.append((shape_bounds, shape))
+
+        if entries:
+            min_x = min(b[0] for b, _ in entries)
+            min_y = min(b[1] for b, _ in entries)
+            max_x = max(b[2] for b, _ in entries)
+            max_y = max(b[3] for b, _ in entries)
+        else:
+            min_x = min_y = 0.0
+            max_x = max_y = 1.0
+
+        self._root = _QuadNode((min_x, min_y, max_x, max_y), depth=0)
+        self._count = len(entries)
+        for item_bounds, shape in entries:
+            self._root.insert(item_bounds, shape)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def query_bounds(self, bounds: Bounds) -> List[Shape]:
+        """
+        Find all shapes whose bounds intersect the given rectangle.
+
+        Args:
+            bounds: Query rectangle as (min_x, min_y, max_x, max_y)
+
+        Returns:
+            List of intersecting Shape objects (unordered)
+        """
+        results: List[Shape] = []
+        self._root.query(bounds, results)
+        return results
+
+    def query_point(self, x: float, y: float, margin: float = 0.0) -> List[Shape]:
+        """
+        Find all shapes whose bounds contain a point (hit-testing).
+
+        Args:
+            x: Point x coordinate
+            y: Point y coordinate
+            margin: Optional tolerance expanding the point into a box
+
+        Returns:
+            List of Shape objects whose bounds contain the point
+        """
+        return self.query_bounds((x - margin, y - margin, x + margin, y + margin))
@@ -1,25 +1,39 @@
 """Styling system models for colors, fills, strokes, and effects."""
 
+import base64
+import operator
+import string
+from functools import cached_property, lru_cache
+from itertools import islice
 from typing import List, Optional, Union, Tuple, Any
-from pydantic import BaseModel, Field, field_validator, model_validator
-import re
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from .types import (
-    BlendMode, LineCap, LineJoin, FillType, Coordinate, 
-    InvalidStyleError, generate_id
+    BlendMode, LineCap, LineJoin, FillType, Coordinate,
+    InvalidStyleError, describe, generate_id
 )
 
+# Byte -> two-char lowercase hex lookup, so to_hex concatenates small
+# interned strings instead of running three format specs per call
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+# Exactly the ASCII hex digits; membership checks against this set are
+# strict where int(v, 16) is lax (signs, whitespace, 0x, Unicode digits)
+_HEX_CHARS = frozenset(string.hexdigits)
+
 
 class RGBColor(BaseModel):
     """RGB color model with values from 0-255."""
     
-    r: int = Field(..., ge=0, le=255, description="Red component (0-255)")
-    g: int = Field(..., ge=0, le=255, description="Green component (0-255)")
-    b: int = Field(..., ge=0, le=255, description="Blue component (0-255)")
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    r: int = Field(..., ge=0, le=255, description=describe("Red component (0-255)"))
+    g: int = Field(..., ge=0, le=255, description=describe("Green component (0-255)"))
+    b: int = Field(..., ge=0, le=255, description=describe("Blue component (0-255)"))
     
     def to_hex(self) -> str:
         """Convert to hex string format."""
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return "#" + _HEX[self.r] + _HEX[self.g] + _HEX[self.b]
     
     def to_tuple(self) -> Tuple[int, int, int]:
         """Convert to RGB tuple."""
@@ -29,37 +43,90 @@ class RGBColor(BaseModel):
 class RGBAColor(BaseModel):
     """RGBA color model with values from 0-255 and alpha 0.0-1.0."""
     
-    r: int = Field(..., ge=0, le=255, description="Red component (0-255)")
-    g: int = Field(..., ge=0, le=255, description="Green component (0-255)")
-    b: int = Field(..., ge=0, le=255, description="Blue component (0-255)")
-    a: float = Field(..., ge=0.0, le=1.0, description="Alpha component (0.0-1.0)")
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    r: int = Field(..., ge=0, le=255, description=describe("Red component (0-255)"))
+    g: int = Field(..., ge=0, le=255, description=describe("Green component (0-255)"))
+    b: int = Field(..., ge=0, le=255, description=describe("Blue component (0-255)"))
+    a: float = Field(..., ge=0.0, le=1.0, description=describe("Alpha component (0.0-1.0)"))
     
     def to_hex(self) -> str:
         """Convert to hex string format with alpha."""
-        alpha_hex = format(round(self.a * 255), '02x')
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}{alpha_hex}"
+        # int(x + 0.5) instead of round(): alpha is in [0.0, 1.0], so the
+        # inline half-up round is safe and skips a builtin dispatch
+        return (
+            "#" + _HEX[self.r] + _HEX[self.g] + _HEX[self.b]
+            + _HEX[int(self.a * 255.0 + 0.5)]
+        )
     
     def to_tuple(self) -> Tuple[int, int, int, float]:
         """Convert to RGBA tuple."""
         return (self.r, self.g, self.b, self.a)
 
 
+def _hsl_to_rgb_components(h: float, s: float, l: float) -> Tuple[int, int, int]:
+    """
+    Convert HSL (h 0-360, s/l 0-100) to 8-bit RGB components.
+
+    Uses the branchless per-channel triangle formulation instead of the
+    six-way hue-sector branch, keeping the hot loop free of data-
+    dependent branches for bulk conversions.
+    """
+    hn = (h % 360.0) / 60.0
+    sn = s / 100.0
+    ln = l / 100.0
+
+    # Per-channel triangle waves over the hue circle, clamped to [0, 1]
+    nr = min(1.0, max(0.0, abs(hn - 3.0) - 1.0))
+    ng = min(1.0, max(0.0, 2.0 - abs(hn - 2.0)))
+    nb = min(1.0, max(0.0, 2.0 - abs(hn - 4.0)))
+
+    # Chroma mix around the lightness midpoint
+    c = (1.0 - abs(2.0 * ln - 1.0)) * sn
+    return (
+        round((ln + c * (nr - 0.5)) * 255.0),
+        round((ln + c * (ng - 0.5)) * 255.0),
+        round((ln + c * (nb - 0.5)) * 255.0),
+    )
+
+
 class HSLColor(BaseModel):
     """HSL color model with hue (0-360), saturation and lightness (0-100)."""
     
-    h: float = Field(..., ge=0.0, le=360.0, description="Hue (0-360)")
-    s: float = Field(..., ge=0.0, le=100.0, description="Saturation (0-100)")
-    l: float = Field(..., ge=0.0, le=100.0, description="Lightness (0-100)")
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    h: float = Field(..., ge=0.0, le=360.0, description=describe("Hue (0-360)"))
+    s: float = Field(..., ge=0.0, le=100.0, description=describe("Saturation (0-100)"))
+    l: float = Field(..., ge=0.0, le=100.0, description=describe("Lightness (0-100)"))
     
     def to_css(self) -> str:
         """Convert to CSS HSL format."""
         return f"hsl({self.h}, {self.s}%, {self.l}%)"
 
+    def to_rgb(self) -> RGBColor:
+        """Convert to RGB color (branchless hue-channel formulation)."""
+        r, g, b = _hsl_to_rgb_components(self.h, self.s, self.l)
+        return RGBColor.model_construct(r=r, g=g, b=b)
+
+    @classmethod
+    def to_rgb_batch(cls, colors: List['HSLColor']) -> List[RGBColor]:
+        """Convert many HSL colors in one pass (gradient tables, themes)."""
+        convert = _hsl_to_rgb_components
+        construct = RGBColor.model_construct
+        out = []
+        for color in colors:
+            r, g, b = convert(color.h, color.s, color.l)
+            out.append(construct(r=r, g=g, b=b))
+        return out
+
 
 class HexColor(BaseModel):
     """Hex color model with validation."""
-    
-    value: str = Field(..., description="Hex color value (e.g., '#FF0000' or '#FF0000FF')")
+
+    # Frozen so the parsed components can be cached safely
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    value: str = Field(..., description=describe("Hex color value (e.g., '#FF0000' or '#FF0000FF')"))
     
     @field_validator('value')
     @classmethod
@@ -76,29 +143,30 @@ class HexColor(BaseModel):
         if len(v) not in [6, 8]:
             raise InvalidStyleError("Hex color must be 6 or 8 characters long")
         
-        # Check if all characters are valid hex
-        if not re.match(r'^[0-9A-Fa-f]+$', v):
+        # Check if all characters are valid hex: set membership per char
+        # beats the regex engine on 6-8 char strings, and unlike int(v, 16)
+        # it admits only the ASCII hex digits
+        if not all(c in _HEX_CHARS for c in v):
             raise InvalidStyleError("Hex color contains invalid characters")
-        
+
         return f"#{v.upper()}"
-    
+
+    @cached_property
+    def components(self) -> Tuple[int, int, int, float]:
+        """Parsed (r, g, b, a) components, computed once per instance."""
+        # One C-level parse instead of three int(str, 16) calls + slices
+        buf = bytes.fromhex(self.value[1:])
+        a = buf[3] / 255.0 if len(buf) == 4 else 1.0
+        return (buf[0], buf[1], buf[2], a)
+
     def to_rgb(self) -> RGBColor:
         """Convert to RGB color."""
-        hex_value = self.value[1:]  # Remove #
-        r = int(hex_value[0:2], 16)
-        g = int(hex_value[2:4], 16)
-        b = int(hex_value[4:6], 16)
+        r, g, b, _ = self.components
         return RGBColor(r=r, g=g, b=b)
-    
+
     def to_rgba(self) -> RGBAColor:
         """Convert to RGBA color."""
-        hex_value = self.value[1:]  # Remove #
-        r = int(hex_value[0:2], 16)
-        g = int(hex_value[2:4], 16)
-        b = int(hex_value[4:6], 16)
-        a = 1.0
-        if len(hex_value) == 8:
-            a = int(hex_value[6:8], 16) / 255.0
+        r, g, b, a = self.components
         return RGBAColor(r=r, g=g, b=b, a=a)
 
 
@@ -106,125 +174,232 @@ class HexColor(BaseModel):
 Color = Union[RGBColor, RGBAColor, HSLColor, HexColor]
 
 
+def rgb_to_hex_batch(components: List[Tuple[int, int, int]]) -> List[str]:
+    """
+    Convert many (r, g, b) tuples to hex strings in one pass.
+
+    For bulk export paths that already hold raw components; the single
+    comprehension over the lookup table skips per-color model and method
+    dispatch entirely.
+    """
+    table = _HEX
+    return ["#" + table[r] + table[g] + table[b] for r, g, b in components]
+
+
+def make_rgb(r: int, g: int, b: int) -> RGBColor:
+    """
+    Build an RGBColor from trusted components, skipping field validation.
+
+    For bulk shape creation with literal or already-validated values;
+    range checks survive only as assertions (dropped under python -O).
+    Untrusted input should go through RGBColor(...) instead.
+    """
+    assert 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255
+    return RGBColor.model_construct(r=r, g=g, b=b)
+
+
+def make_rgba(r: int, g: int, b: int, a: float = 1.0) -> RGBAColor:
+    """
+    Build an RGBAColor from trusted components, skipping field validation.
+
+    See make_rgb for the trust contract.
+    """
+    assert 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255 and 0.0 <= a <= 1.0
+    return RGBAColor.model_construct(r=r, g=g, b=b, a=a)
+
+
 class GradientStop(BaseModel):
     """A color stop in a gradient."""
-    
-    position: float = Field(..., ge=0.0, le=1.0, description="Position along gradient (0.0-1.0)")
-    color: Color = Field(..., description="Color at this position")
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    position: float = Field(..., ge=0.0, le=1.0, description=describe("Position along gradient (0.0-1.0)"))
+    color: Color = Field(..., description=describe("Color at this position"))
+
+
+# Sort key for gradient stops; attrgetter avoids per-comparison lambda frames
+_stop_position = operator.attrgetter('position')
+
+
+def _validate_gradient_stops(v: List[GradientStop]) -> List[GradientStop]:
+    """Shared stop validation: sort by position and reject duplicates."""
+    if len(v) < 2:
+        raise InvalidStyleError("Gradient must have at least 2 color stops")
+
+    # Fast path: programmatically authored stops are usually already in
+    # strictly increasing order, which also proves there are no duplicates
+    prev = v[0].position
+    for stop in islice(v, 1, None):
+        if stop.position <= prev:
+            break
+        prev = stop.position
+    else:
+        return v
+
+    sorted_stops = sorted(v, key=_stop_position)
+
+    # Duplicates are adjacent after sorting; compare neighbours instead of
+    # materializing a positions list plus a set
+    prev = sorted_stops[0].position
+    for stop in islice(sorted_stops, 1, None):
+        if stop.position == prev:
+            raise InvalidStyleError("Gradient stops cannot have duplicate positions")
+        prev = stop.position
+
+    return sorted_stops
 
 
 class LinearGradient(BaseModel):
     """Linear gradient definition."""
     
-    id: str = Field(default_factory=generate_id, description="Unique gradient ID")
-    start_x: Coordinate = Field(0.0, description="Starting X coordinate")
-    start_y: Coordinate = Field(0.0, description="Starting Y coordinate") 
-    end_x: Coordinate = Field(1.0, description="Ending X coordinate")
-    end_y: Coordinate = Field(1.0, description="Ending Y coordinate")
-    stops: List[GradientStop] = Field(..., min_length=2, description="Color stops")
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    id: str = Field(default_factory=generate_id, description=describe("Unique gradient ID"))
+    start_x: Coordinate = Field(0.0, description=describe("Starting X coordinate"))
+    start_y: Coordinate = Field(0.0, description=describe("Starting Y coordinate")) 
+    end_x: Coordinate = Field(1.0, description=describe("Ending X coordinate"))
+    end_y: Coordinate = Field(1.0, description=describe("Ending Y coordinate"))
+    stops: List[GradientStop] = Field(..., min_length=2, description=describe("Color stops"))
     
     @field_validator('stops')
     @classmethod
     def validate_stops(cls, v: List[GradientStop]) -> List[GradientStop]:
         """Validate gradient stops are properly ordered."""
-        if len(v) < 2:
-            raise InvalidStyleError("Gradient must have at least 2 color stops")
-        
-        # Sort by position
-        sorted_stops = sorted(v, key=lambda stop: stop.position)
-        
-        # Check for duplicate positions
-        positions = [stop.position for stop in sorted_stops]
-        if len(set(positions)) != len(positions):
-            raise InvalidStyleError("Gradient stops cannot have duplicate positions")
-        
-        return sorted_stops
+        return _validate_gradient_stops(v)
 
 
 class RadialGradient(BaseModel):
     """Radial gradient definition."""
     
-    id: str = Field(default_factory=generate_id, description="Unique gradient ID")
-    center_x: Coordinate = Field(0.5, description="Center X coordinate")
-    center_y: Coordinate = Field(0.5, description="Center Y coordinate")
-    radius: Coordinate = Field(0.5, ge=0.0, description="Gradient radius")
-    stops: List[GradientStop] = Field(..., min_length=2, description="Color stops")
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    id: str = Field(default_factory=generate_id, description=describe("Unique gradient ID"))
+    center_x: Coordinate = Field(0.5, description=describe("Center X coordinate"))
+    center_y: Coordinate = Field(0.5, description=describe("Center Y coordinate"))
+    radius: Coordinate = Field(0.5, ge=0.0, description=describe("Gradient radius"))
+    stops: List[GradientStop] = Field(..., min_length=2, description=describe("Color stops"))
     
     @field_validator('stops')
     @classmethod
     def validate_stops(cls, v: List[GradientStop]) -> List[GradientStop]:
         """Validate gradient stops are properly ordered."""
-        if len(v) < 2:
-            raise InvalidStyleError("Gradient must have at least 2 color stops")
-        
-        # Sort by position
-        sorted_stops = sorted(v, key=lambda stop: stop.position)
-        
-        # Check for duplicate positions
-        positions = [stop.position for stop in sorted_stops]
-        if len(set(positions)) != len(positions):
-            raise InvalidStyleError("Gradient stops cannot have duplicate positions")
-        
-        return sorted_stops
+        return _validate_gradient_stops(v)
 
 
 class PatternFill(BaseModel):
     """Pattern fill definition."""
     
-    id: str = Field(default_factory=generate_id, description="Unique pattern ID")
-    image_data: str = Field(..., description="Base64 encoded image data or URL")
-    width: Coordinate = Field(..., gt=0, description="Pattern width")
-    height: Coordinate = Field(..., gt=0, description="Pattern height")
-    repeat_x: bool = Field(True, description="Repeat pattern horizontally")
-    repeat_y: bool = Field(True, description="Repeat pattern vertically")
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    id: str = Field(default_factory=generate_id, description=describe("Unique pattern ID"))
+    image_data: str = Field(..., description=describe("Base64 encoded image data or URL"))
+    width: Coordinate = Field(..., gt=0, description=describe("Pattern width"))
+    height: Coordinate = Field(..., gt=0, description=describe("Pattern height"))
+    repeat_x: bool = Field(True, description=describe("Repeat pattern horizontally"))
+    repeat_y: bool = Field(True, description=describe("Repeat pattern vertically"))
+
+    @cached_property
+    def image_bytes(self) -> Optional[bytes]:
+        """
+        Decoded raw image bytes, computed once per instance.
+
+        Handles bare base64 and data: URLs; plain URL references return
+        None since there is nothing local to decode. Renderers should
+        use this (or image_view) instead of re-decoding image_data per
+        draw.
+        """
+        data = self.image_data
+        if data.startswith('data:'):
+            data = data.partition(',')[2]
+        elif '://' in data:
+            return None
+        try:
+            return base64.b64decode(data)
+        except ValueError:
+            return None
+
+    @property
+    def image_view(self) -> Optional[memoryview]:
+        """Zero-copy view over the decoded image bytes."""
+        raw = self.image_bytes
+        return memoryview(raw) if raw is not None else None
+
+
+# Which data field each fill type requires; anything else gets cleared
+_FILL_TYPE_FIELD = {
+    FillType.SOLID: 'color',
+    FillType.LINEAR_GRADIENT: 'linear_gradient',
+    FillType.RADIAL_GRADIENT: 'radial_gradient',
+    FillType.PATTERN: 'pattern',
+}
+_FILL_TYPE_FIELDS = frozenset(_FILL_TYPE_FIELD.values())
 
 
 class FillProperties(BaseModel):
     """Fill properties for shapes."""
-    
-    type: FillType = Field(FillType.SOLID, description="Type of fill")
-    color: Optional[Color] = Field(None, description="Solid color fill")
-    linear_gradient: Optional[LinearGradient] = Field(None, description="Linear gradient fill")
-    radial_gradient: Optional[RadialGradient] = Field(None, description="Radial gradient fill")
-    pattern: Optional[PatternFill] = Field(None, description="Pattern fill")
-    opacity: float = Field(1.0, ge=0.0, le=1.0, description="Fill opacity")
-    
-    @model_validator(mode='after')
-    def validate_fill_consistency(self) -> 'FillProperties':
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    type: FillType = Field(FillType.SOLID, description=describe("Type of fill"))
+    color: Optional[Color] = Field(None, description=describe("Solid color fill"))
+    linear_gradient: Optional[LinearGradient] = Field(None, description=describe("Linear gradient fill"))
+    radial_gradient: Optional[RadialGradient] = Field(None, description=describe("Radial gradient fill"))
+    pattern: Optional[PatternFill] = Field(None, description=describe("Pattern fill"))
+    opacity: float = Field(1.0, ge=0.0, le=1.0, description=describe("Fill opacity"))
+
+    @model_validator(mode='before')
+    @classmethod
+    def validate_fill_consistency(cls, data: Any) -> Any:
         """Validate that fill type matches the provided fill data."""
-        if self.type == FillType.SOLID and not self.color:
-            raise InvalidStyleError("Solid fill requires a color")
-        elif self.type == FillType.LINEAR_GRADIENT and not self.linear_gradient:
-            raise InvalidStyleError("Linear gradient fill requires linear_gradient data")
-        elif self.type == FillType.RADIAL_GRADIENT and not self.radial_gradient:
-            raise InvalidStyleError("Radial gradient fill requires radial_gradient data")
-        elif self.type == FillType.PATTERN and not self.pattern:
-            raise InvalidStyleError("Pattern fill requires pattern data")
-        
-        # Clear unused fill data
-        if self.type != FillType.SOLID:
-            self.color = None
-        if self.type != FillType.LINEAR_GRADIENT:
-            self.linear_gradient = None
-        if self.type != FillType.RADIAL_GRADIENT:
-            self.radial_gradient = None
-        if self.type != FillType.PATTERN:
-            self.pattern = None
-        
-        return self
+        if not isinstance(data, dict):
+            return data
+
+        fill_type = data.get('type', FillType.SOLID)
+        if not isinstance(fill_type, FillType):
+            try:
+                fill_type = FillType(fill_type)
+            except ValueError:
+                return data  # let field validation report the bad type
+
+        required = _FILL_TYPE_FIELD[fill_type]
+        if not data.get(required):
+            # Identity check: enum members are singletons, and == on a
+            # str-Enum falls through to string comparison
+            if fill_type is FillType.SOLID:
+                raise InvalidStyleError("Solid fill requires a color")
+            raise InvalidStyleError(
+                f"{fill_type.value.replace('_', ' ').capitalize()} fill "
+                f"requires {required} data"
+            )
+
+        # Drop unused fill data before construction, so pydantic never
+        # validates gradient/pattern sub-models that would be discarded.
+        # Leave the caller's dict untouched; skip the rebuild when there
+        # is nothing to prune (the common case)
+        if any(
+            field != required and data.get(field) is not None
+            for field in _FILL_TYPE_FIELDS
+        ):
+            data = {
+                key: value for key, value in data.items()
+                if key == required or key not in _FILL_TYPE_FIELDS or value is None
+            }
+        return data
 
 
 class StrokeProperties(BaseModel):
     """Stroke properties for shapes."""
     
-    color: Color = Field(..., description="Stroke color")
-    width: Coordinate = Field(1.0, gt=0.0, description="Stroke width")
-    cap: LineCap = Field(LineCap.BUTT, description="Line cap style")
-    join: LineJoin = Field(LineJoin.MITER, description="Line join style")
-    miter_limit: float = Field(4.0, gt=0.0, description="Miter limit for miter joins")
-    dash_array: Optional[List[float]] = Field(None, description="Dash pattern array")
-    dash_offset: float = Field(0.0, description="Dash pattern offset")
-    opacity: float = Field(1.0, ge=0.0, le=1.0, description="Stroke opacity")
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    color: Color = Field(..., description=describe("Stroke color"))
+    width: Coordinate = Field(1.0, gt=0.0, description=describe("Stroke width"))
+    cap: LineCap = Field(LineCap.BUTT, description=describe("Line cap style"))
+    join: LineJoin = Field(LineJoin.MITER, description=describe("Line join style"))
+    miter_limit: float = Field(4.0, gt=0.0, description=describe("Miter limit for miter joins"))
+    dash_array: Optional[List[float]] = Field(None, description=describe("Dash pattern array"))
+    dash_offset: float = Field(0.0, description=describe("Dash pattern offset"))
+    opacity: float = Field(1.0, ge=0.0, le=1.0, description=describe("Stroke opacity"))
     
     @field_validator('dash_array')
     @classmethod
@@ -241,24 +416,57 @@ class StrokeProperties(BaseModel):
 class ShadowEffect(BaseModel):
     """Drop shadow effect."""
     
-    offset_x: Coordinate = Field(0.0, description="Horizontal shadow offset")
-    offset_y: Coordinate = Field(0.0, description="Vertical shadow offset")
-    blur_radius: Coordinate = Field(0.0, ge=0.0, description="Shadow blur radius")
-    spread_radius: Coordinate = Field(0.0, description="Shadow spread radius")
-    color: Color = Field(..., description="Shadow color")
-    inset: bool = Field(False, description="Inner shadow")
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    offset_x: Coordinate = Field(0.0, description=describe("Horizontal shadow offset"))
+    offset_y: Coordinate = Field(0.0, description=describe("Vertical shadow offset"))
+    blur_radius: Coordinate = Field(0.0, ge=0.0, description=describe("Shadow blur radius"))
+    spread_radius: Coordinate = Field(0.0, description=describe("Shadow spread radius"))
+    color: Color = Field(..., description=describe("Shadow color"))
+    inset: bool = Field(False, description=describe("Inner shadow"))
 
 
 class BlurEffect(BaseModel):
     """Blur effect."""
     
-    radius: Coordinate = Field(0.0, ge=0.0, description="Blur radius")
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    radius: Coordinate = Field(0.0, ge=0.0, description=describe("Blur radius"))
 
 
 class Effects(BaseModel):
     """Collection of visual effects."""
     
-    shadows: List[ShadowEffect] = Field(default_factory=list, description="Drop shadows")
-    blur: Optional[BlurEffect] = Field(None, description="Blur effect")
-    opacity: float = Field(1.0, ge=0.0, le=1.0, description="Overall opacity")
-    blend_mode: BlendMode = Field(BlendMode.NORMAL, description="Blend mode")
\ No newline at end of file
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    shadows: List[ShadowEffect] = Field(default_factory=list, description=describe("Drop shadows"))
+    blur: Optional[BlurEffect] = Field(None, description=describe("Blur effect"))
+    opacity: float = Field(1.0, ge=0.0, le=1.0, description=describe("Overall opacity"))
+    blend_mode: BlendMode = Field(BlendMode.NORMAL, description=describe("Blend mode"))
+
+@lru_cache(maxsize=1024)
+def solid_fill(r: int, g: int, b: int, opacity: float = 1.0) -> FillProperties:
+    """
+    Get a shared solid FillProperties for an RGB color.
+
+    Identical (r, g, b, opacity) requests return the same frozen
+    instance, so documents with a small palette validate each distinct
+    fill once instead of once per shape.
+    """
+    return FillProperties(type=FillType.SOLID, color=RGBColor(r=r, g=g, b=b), opacity=opacity)  # type: ignore
+
+
+@lru_cache(maxsize=1024)
+def solid_stroke(
+    r: int, g: int, b: int,
+    width: Coordinate = 1.0,
+    cap: LineCap = LineCap.BUTT,
+    join: LineJoin = LineJoin.MITER,
+) -> StrokeProperties:
+    """
+    Get a shared StrokeProperties for an RGB color and line settings.
+
+    See solid_fill for the sharing contract; instances are frozen and
+    safe to alias across shapes.
+    """
+    return StrokeProperties(color=RGBColor(r=r, g=g, b=b), width=width, cap=cap, join=join)  # type: ignore
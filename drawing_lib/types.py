@@ -1,8 +1,10 @@
 """Core type definitions and enums for the drawing library."""
 
+import itertools
+import os
+import sys
 from enum import Enum
-from typing import Any, Dict, Union
-import uuid
+from typing import Any, Dict, Optional, Union
 
 
 class ShapeType(str, Enum):
@@ -70,6 +72,14 @@ class Units(str, Enum):
     CENTIMETERS = "cm"
 
 
+# Intern every enum value string so dicts and sets keyed on them (dispatch
+# tables, serialized-tag lookups) hit the pointer-equality fast path
+for _enum_cls in (ShapeType, BlendMode, LineCap, LineJoin, FillType, Units):
+    for _member in _enum_cls:
+        sys.intern(_member.value)
+del _enum_cls, _member
+
+
 # Type aliases for common use cases
 ID = str
 Coordinate = float
@@ -77,9 +87,27 @@ Color = str  # Hex color like "#FF0000" or named color
 GeometryDict = Dict[str, Any]
 
 
+# One random prefix per process plus a monotonically increasing counter:
+# unique within a process by construction, unique across processes via
+# the prefix, and much cheaper than a uuid4 per call
+_ID_PREFIX = os.urandom(8).hex()
+_id_counter = itertools.count()
+
+
 def generate_id() -> ID:
     """Generate a unique string-based ID for performance optimization."""
-    return str(uuid.uuid4())
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+# Set DRAWING_LIB_SLIM to drop Field description strings: they are kept
+# alive on every FieldInfo and copied into generated JSON schemas, which
+# matters for memory-constrained deployments that never introspect schemas
+_SLIM = bool(os.environ.get("DRAWING_LIB_SLIM"))
+
+
+def describe(text: str) -> Optional[str]:
+    """Return a Field description, or None in a slim build."""
+    return None if _SLIM else text
 
 
 class DrawingLibraryError(Exception):
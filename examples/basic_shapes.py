@@ -10,139 +10,109 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from drawing_lib import (
-    DrawingDocument, Shape, ShapeType,
-    RGBColor, FillProperties, StrokeProperties, StyleProperties,
-    Transform, Units
-)
+from drawing_lib import DrawingDocument, Shape
 from svg_export import export_document_to_svg
 
 
 def create_basic_shapes_document():
     """Create a document with basic shapes demonstrating core functionality."""
-    
+
     # Create a new document with web preset
     doc = DrawingDocument.create_preset(
-        "web", 
+        "web",
         title="Basic Shapes Demo",
         author="Drawing Library Example"
     )
-    
+
     # Create layers for organization
     background_layer = doc.create_layer("Background")
     shapes_layer = doc.create_layer("Basic Shapes")
     text_layer = doc.create_layer("Labels")
-    
-    # Define common colors
-    red = RGBColor(r=255, g=50, b=50)
-    blue = RGBColor(r=50, g=150, b=255)
-    green = RGBColor(r=50, g=200, b=50)
-    black = RGBColor(r=0, g=0, b=0)
-    white = RGBColor(r=255, g=255, b=255)
-    
-    # 1. Rectangle with fill and stroke
-    rect_fill = FillProperties(color=red, opacity=0.8)
-    rect_stroke = StrokeProperties(color=black, width=3.0)
-    rect_style = StyleProperties(fill=rect_fill, stroke=rect_stroke)
-    rect_transform = Transform(x=100.0, y=100.0)
-    
-    rectangle = Shape(
-        type=ShapeType.RECTANGLE,
-        geometry={"width": 200.0, "height": 120.0, "corner_radius": 10.0},
-        style=rect_style,
-        transform=rect_transform,
-        name="Red Rectangle"
-    )
-    
-    # 2. Circle with gradient-like effect using opacity
-    circle_fill = FillProperties(color=blue, opacity=0.7)
-    circle_style = StyleProperties(fill=circle_fill)
-    circle_transform = Transform(x=400.0, y=150.0)
-    
-    circle = Shape(
-        type=ShapeType.CIRCLE,
-        geometry={"radius": 80.0},
-        style=circle_style,
-        transform=circle_transform,
-        name="Blue Circle"
-    )
-    
-    # 3. Triangle using polygon
-    triangle_fill = FillProperties(color=green)
-    triangle_stroke = StrokeProperties(color=black, width=2.0)
-    triangle_style = StyleProperties(fill=triangle_fill, stroke=triangle_stroke)
-    triangle_transform = Transform(x=700.0, y=100.0)
-    
-    triangle = Shape(
-        type=ShapeType.POLYGON,
-        geometry={"points": [[0.0, 120.0], [100.0, 120.0], [50.0, 20.0]]},
-        style=triangle_style,
-        transform=triangle_transform,
-        name="Green Triangle"
-    )
-    
-    # 4. Line with thick stroke
-    line_stroke = StrokeProperties(color=black, width=5.0)
-    line_style = StyleProperties(stroke=line_stroke)
-    line_transform = Transform(x=100.0, y=300.0)
-    
-    line = Shape(
-        type=ShapeType.LINE,
-        geometry={"x1": 0.0, "y1": 0.0, "x2": 600.0, "y2": 100.0},
-        style=line_style,
-        transform=line_transform,
-        name="Diagonal Line"
-    )
-    
-    # 5. Ellipse
-    ellipse_fill = FillProperties(color=RGBColor(r=255, g=200, b=50))
-    ellipse_stroke = StrokeProperties(color=black, width=2.0)
-    ellipse_style = StyleProperties(fill=ellipse_fill, stroke=ellipse_stroke)
-    ellipse_transform = Transform(x=150.0, y=450.0)
-    
-    ellipse = Shape(
-        type=ShapeType.ELLIPSE,
-        geometry={"rx": 120.0, "ry": 60.0},
-        style=ellipse_style,
-        transform=ellipse_transform,
-        name="Yellow Ellipse"
-    )
-    
-    # 6. Path for complex shape
-    path_stroke = StrokeProperties(color=RGBColor(r=150, g=50, b=150), width=4.0)
-    path_style = StyleProperties(stroke=path_stroke)
-    path_transform = Transform(x=500.0, y=400.0)
-    
-    path = Shape(
-        type=ShapeType.PATH,
-        geometry={
-            "path_data": "M 0,0 C 0,-50 50,-50 50,0 C 50,50 100,50 100,0 L 150,0"
+
+    # Define common colors as plain dicts
+    red = {"r": 255, "g": 50, "b": 50}
+    blue = {"r": 50, "g": 150, "b": 255}
+    green = {"r": 50, "g": 200, "b": 50}
+    black = {"r": 0, "g": 0, "b": 0}
+
+    # Describe every shape as a plain dict and validate the whole batch in
+    # one pass: pydantic-core walks the nested schema (shape -> style ->
+    # fill/stroke -> color) in compiled code, instead of one Python
+    # constructor call per model instance
+    shapes = Shape.validate_many([
+        # 1. Rectangle with fill and stroke
+        {
+            "type": "rectangle",
+            "geometry": {"width": 200.0, "height": 120.0, "corner_radius": 10.0},
+            "style": {
+                "fill": {"color": red, "opacity": 0.8},
+                "stroke": {"color": black, "width": 3.0},
+            },
+            "transform": {"x": 100.0, "y": 100.0},
+            "name": "Red Rectangle",
         },
-        style=path_style,
-        transform=path_transform,
-        name="Purple Wave"
-    )
-    
-    # Add background
-    bg_fill = FillProperties(color=RGBColor(r=248, g=249, b=250))
-    bg_style = StyleProperties(fill=bg_fill)
-    
-    background = Shape(
-        type=ShapeType.RECTANGLE,
-        geometry={"width": doc.canvas.width, "height": doc.canvas.height},
-        style=bg_style,
-        name="Background"
-    )
-    
-    # Add shapes to layers
-    background_layer.add_shape(background)
-    shapes_layer.add_shape(rectangle)
-    shapes_layer.add_shape(circle)
-    shapes_layer.add_shape(triangle)
-    shapes_layer.add_shape(line)
-    shapes_layer.add_shape(ellipse)
-    shapes_layer.add_shape(path)
-    
+        # 2. Circle with gradient-like effect using opacity
+        {
+            "type": "circle",
+            "geometry": {"radius": 80.0},
+            "style": {"fill": {"color": blue, "opacity": 0.7}},
+            "transform": {"x": 400.0, "y": 150.0},
+            "name": "Blue Circle",
+        },
+        # 3. Triangle using polygon
+        {
+            "type": "polygon",
+            "geometry": {"points": [[0.0, 120.0], [100.0, 120.0], [50.0, 20.0]]},
+            "style": {
+                "fill": {"color": green},
+                "stroke": {"color": black, "width": 2.0},
+            },
+            "transform": {"x": 700.0, "y": 100.0},
+            "name": "Green Triangle",
+        },
+        # 4. Line with thick stroke
+        {
+            "type": "line",
+            "geometry": {"x1": 0.0, "y1": 0.0, "x2": 600.0, "y2": 100.0},
+            "style": {"stroke": {"color": black, "width": 5.0}},
+            "transform": {"x": 100.0, "y": 300.0},
+            "name": "Diagonal Line",
+        },
+        # 5. Ellipse
+        {
+            "type": "ellipse",
+            "geometry": {"rx": 120.0, "ry": 60.0},
+            "style": {
+                "fill": {"color": {"r": 255, "g": 200, "b": 50}},
+                "stroke": {"color": black, "width": 2.0},
+            },
+            "transform": {"x": 150.0, "y": 450.0},
+            "name": "Yellow Ellipse",
+        },
+        # 6. Path for complex shape
+        {
+            "type": "path",
+            "geometry": {
+                "path_data": "M 0,0 C 0,-50 50,-50 50,0 C 50,50 100,50 100,0 L 150,0"
+            },
+            "style": {"stroke": {"color": {"r": 150, "g": 50, "b": 150}, "width": 4.0}},
+            "transform": {"x": 500.0, "y": 400.0},
+            "name": "Purple Wave",
+        },
+        # Background sized to the canvas
+        {
+            "type": "rectangle",
+            "geometry": {"width": doc.canvas.width, "height": doc.canvas.height},
+            "style": {"fill": {"color": {"r": 248, "g": 249, "b": 250}}},
+            "name": "Background",
+        },
+    ])
+
+    # Add shapes to layers (background spec is last in the batch)
+    background_layer.add_shape(shapes[-1])
+    for shape in shapes[:-1]:
+        shapes_layer.add_shape(shape)
+
     return doc
 
 
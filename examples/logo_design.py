@@ -19,6 +19,18 @@ from drawing_lib import (
 from svg_export import export_document_to_svg
 
 
+# Brand palette, built once at module scope so every shape shares the
+# same color instances instead of constructing fresh models per call
+BRAND_COLORS = {
+    'primary_blue': RGBColor(r=25, g=118, b=210),
+    'secondary_blue': RGBColor(r=66, g=165, b=245),
+    'accent_orange': RGBColor(r=255, g=152, b=0),
+    'dark_gray': RGBColor(r=66, g=66, b=66),
+    'light_gray': RGBColor(r=245, g=245, b=245),
+    'white': RGBColor(r=255, g=255, b=255)
+}
+
+
 def create_logo_document():
     """Create a logo design document with corporate branding elements."""
     
@@ -39,90 +51,80 @@ def create_logo_document():
     text_layer = doc.create_layer("Company Text", parent_group=logo_group)
     tagline_layer = doc.create_layer("Tagline", parent_group=logo_group)
     
-    # Define brand colors
-    primary_blue = RGBColor(r=25, g=118, b=210)
-    secondary_blue = RGBColor(r=66, g=165, b=245)
-    accent_orange = RGBColor(r=255, g=152, b=0)
-    dark_gray = RGBColor(r=66, g=66, b=66)
-    light_gray = RGBColor(r=245, g=245, b=245)
-    white = RGBColor(r=255, g=255, b=255)
-    
     return doc, {
         'background_layer': background_layer,
         'icon_layer': icon_layer,
         'text_layer': text_layer,
         'tagline_layer': tagline_layer,
-        'colors': {
-            'primary_blue': primary_blue,
-            'secondary_blue': secondary_blue,
-            'accent_orange': accent_orange,
-            'dark_gray': dark_gray,
-            'light_gray': light_gray,
-            'white': white
-        }
+        'colors': BRAND_COLORS
     }
 
 
+# Icon layout: per-element offsets from the icon center, plus the two
+# triangle outlines. Hoisted to module scope so repeat calls reuse the
+# same tuples instead of reallocating the literals
+_ICON_OFFSETS = ((0.0, 0.0), (-40.0, -40.0), (30.0, 20.0), (30.0, 80.0))
+_TRI1_PTS = ((0.0, 0.0), (60.0, 0.0), (30.0, -52.0))
+_TRI2_PTS = ((0.0, 0.0), (60.0, 0.0), (30.0, 52.0))
+
+
 def create_logo_icon(icon_layer, colors, center_x=1275.0, center_y=1000.0):
     """Create a modern geometric logo icon."""
-    
+
+    # Resolve all four element positions from the center in one pass,
+    # then build the transforms from the precomputed pairs
+    positions = [(center_x + dx, center_y + dy) for dx, dy in _ICON_OFFSETS]
+
     # Main circle background
     main_circle_fill = FillProperties(color=colors['primary_blue'])
     main_circle_style = StyleProperties(fill=main_circle_fill)
-    main_circle_transform = Transform(x=center_x, y=center_y)
-    
+
     main_circle = Shape(
         type=ShapeType.CIRCLE,
         geometry={"radius": 150.0},
         style=main_circle_style,
-        transform=main_circle_transform,
+        transform=Transform.translate(*positions[0]),
         name="Main Circle"
     )
-    
+
     # Inner accent circle
     accent_circle_fill = FillProperties(color=colors['accent_orange'])
     accent_circle_style = StyleProperties(fill=accent_circle_fill)
-    accent_circle_transform = Transform(x=center_x - 40.0, y=center_y - 40.0)
-    
+
     accent_circle = Shape(
         type=ShapeType.CIRCLE,
         geometry={"radius": 60.0},
         style=accent_circle_style,
-        transform=accent_circle_transform,
+        transform=Transform.translate(*positions[1]),
         name="Accent Circle"
     )
-    
+
     # Geometric triangles for modern look
     triangle1_fill = FillProperties(color=colors['white'], opacity=0.9)
     triangle1_style = StyleProperties(fill=triangle1_fill)
-    triangle1_transform = Transform(x=center_x + 30.0, y=center_y + 20.0)
-    
+
     triangle1 = Shape(
         type=ShapeType.POLYGON,
-        geometry={"points": [[0.0, 0.0], [60.0, 0.0], [30.0, -52.0]]},
+        geometry={"points": _TRI1_PTS},
         style=triangle1_style,
-        transform=triangle1_transform,
+        transform=Transform.translate(*positions[2]),
         name="Triangle 1"
     )
-    
+
     triangle2_fill = FillProperties(color=colors['secondary_blue'], opacity=0.8)
     triangle2_style = StyleProperties(fill=triangle2_fill)
-    triangle2_transform = Transform(x=center_x + 30.0, y=center_y + 80.0)
-    
+
     triangle2 = Shape(
         type=ShapeType.POLYGON,
-        geometry={"points": [[0.0, 0.0], [60.0, 0.0], [30.0, 52.0]]},
+        geometry={"points": _TRI2_PTS},
         style=triangle2_style,
-        transform=triangle2_transform,
+        transform=Transform.translate(*positions[3]),
         name="Triangle 2"
     )
-    
+
     # Add shapes to icon layer
-    icon_layer.add_shape(main_circle)
-    icon_layer.add_shape(accent_circle)
-    icon_layer.add_shape(triangle1)
-    icon_layer.add_shape(triangle2)
-    
+    icon_layer.add_shapes([main_circle, accent_circle, triangle1, triangle2])
+
     return center_x, center_y + 200.0  # Return position for next elements
 
 
@@ -143,7 +145,7 @@ def create_company_text(text_layer, colors, start_x, start_y):
         type=ShapeType.RECTANGLE,
         geometry={"width": letter_width, "height": stroke_width},
         style=text_style,
-        transform=Transform(x=start_x, y=start_y),
+        transform=Transform.translate(start_x, start_y),
         name="T Horizontal"
     )
     
@@ -151,7 +153,7 @@ def create_company_text(text_layer, colors, start_x, start_y):
         type=ShapeType.RECTANGLE,
         geometry={"width": stroke_width, "height": letter_height},
         style=text_style,
-        transform=Transform(x=start_x + letter_width/2 - stroke_width/2, y=start_y),
+        transform=Transform.translate(start_x + letter_width/2 - stroke_width/2, start_y),
         name="T Vertical"
     )
     
@@ -160,7 +162,7 @@ def create_company_text(text_layer, colors, start_x, start_y):
         type=ShapeType.RECTANGLE,
         geometry={"width": stroke_width, "height": letter_height},
         style=text_style,
-        transform=Transform(x=start_x + letter_spacing, y=start_y),
+        transform=Transform.translate(start_x + letter_spacing, start_y),
         name="E Vertical"
     )
     
@@ -168,7 +170,7 @@ def create_company_text(text_layer, colors, start_x, start_y):
         type=ShapeType.RECTANGLE,
         geometry={"width": letter_width - stroke_width, "height": stroke_width},
         style=text_style,
-        transform=Transform(x=start_x + letter_spacing + stroke_width, y=start_y),
+        transform=Transform.translate(start_x + letter_spacing + stroke_width, start_y),
         name="E Top"
     )
     
@@ -176,7 +178,7 @@ def create_company_text(text_layer, colors, start_x, start_y):
         type=ShapeType.RECTANGLE,
         geometry={"width": letter_width - stroke_width - 15, "height": stroke_width},
         style=text_style,
-        transform=Transform(x=start_x + letter_spacing + stroke_width, y=start_y + letter_height/2),
+        transform=Transform.translate(start_x + letter_spacing + stroke_width, start_y + letter_height/2),
         name="E Middle"
     )
     
@@ -184,7 +186,7 @@ def create_company_text(text_layer, colors, start_x, start_y):
         type=ShapeType.RECTANGLE,
         geometry={"width": letter_width - stroke_width, "height": stroke_width},
         style=text_style,
-        transform=Transform(x=start_x + letter_spacing + stroke_width, y=start_y + letter_height - stroke_width),
+        transform=Transform.translate(start_x + letter_spacing + stroke_width, start_y + letter_height - stroke_width),
         name="E Bottom"
     )
     
@@ -196,7 +198,7 @@ def create_company_text(text_layer, colors, start_x, start_y):
         type=ShapeType.RECTANGLE,
         geometry={"width": 200.0, "height": 4.0},
         style=accent_line_style,
-        transform=Transform(x=start_x, y=start_y + letter_height + 20.0),
+        transform=Transform.translate(start_x, start_y + letter_height + 20.0),
         name="Accent Line"
     )
     
@@ -208,27 +210,38 @@ def create_company_text(text_layer, colors, start_x, start_y):
     return start_y + letter_height + 60.0  # Return position for tagline
 
 
+def _tagline_positions(start_x, start_y, words=3, chars=8):
+    """Compute dash positions separately from shape construction."""
+    return [
+        (start_x + i * 120.0 + j * 15.0, start_y + (i % 2) * 5.0)
+        for i in range(words)
+        for j in range(chars)
+    ]
+
+
 def create_tagline(tagline_layer, colors, start_x, start_y):
     """Create tagline using simple geometric representation."""
-    
+
     # Tagline "Innovation Through Technology" represented as lines
     line_stroke = StrokeProperties(color=colors['secondary_blue'], width=3.0)
     line_style = StyleProperties(stroke=line_stroke)
-    
-    # Create series of lines to represent text
-    for i in range(3):  # 3 words
-        for j in range(8):  # 8 characters per word average
-            line = Shape(
-                type=ShapeType.LINE,
-                geometry={"x1": 0.0, "y1": 0.0, "x2": 12.0, "y2": 0.0},
-                style=line_style,
-                transform=Transform(
-                    x=start_x + i * 120.0 + j * 15.0,
-                    y=start_y + (i % 2) * 5.0  # Slight wave effect
-                ),
-                name=f"Tagline Word {i+1} Char {j+1}"
-            )
-            tagline_layer.add_shape(line)
+
+    # The tagline is 3 words of ~8 character dashes with a slight wave
+    # effect on alternating words. All 24 dashes are coalesced into a
+    # single path of disjoint moveto/lineto segments, so the layer holds
+    # one shape instead of 24 and the SVG export emits one <path>
+    path_data = " ".join(
+        f"M {x:.1f},{y:.1f} l 12,0"
+        for x, y in _tagline_positions(start_x, start_y)
+    )
+
+    tagline = Shape.fast(
+        type=ShapeType.PATH,
+        geometry={"path_data": path_data},
+        style=line_style,
+        name="Tagline Dashes"
+    )
+    tagline_layer.add_shape(tagline)
 
 
 def create_background_elements(background_layer, colors, doc):
@@ -254,7 +267,7 @@ def create_background_elements(background_layer, colors, doc):
         type=ShapeType.CIRCLE,
         geometry={"radius": 300.0},
         style=corner_style,
-        transform=Transform(x=-150.0, y=-150.0),
+        transform=Transform.translate(-150.0, -150.0),
         name="Corner TL"
     )
     
@@ -263,7 +276,7 @@ def create_background_elements(background_layer, colors, doc):
         type=ShapeType.CIRCLE,
         geometry={"radius": 400.0},
         style=corner_style,
-        transform=Transform(x=doc.canvas.width - 200.0, y=doc.canvas.height - 200.0),
+        transform=Transform.translate(doc.canvas.width - 200.0, doc.canvas.height - 200.0),
         name="Corner BR"
     )
     
@@ -305,11 +318,10 @@ def main():
         print(f"{indent}- {layer.name}: {layer.get_shape_count()} shapes")
     
     # Save the design
-    json_data = doc.model_dump_json(indent=2)
     with open("logo_design_output.json", "w") as f:
-        f.write(json_data)
+        json_size = doc.dump_json_to(f)
     print(f"\nSaved logo design to: logo_design_output.json")
-    print(f"JSON file size: {len(json_data)} characters")
+    print(f"JSON file size: {json_size} characters")
     
     # Export to SVG
     svg_content = export_document_to_svg(doc, "logo_design_output.svg")
@@ -10,9 +10,146 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from drawing_lib import DrawingDocument, Shape, ShapeType, RGBColor, Units
+import functools
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+from drawing_lib import DrawingDocument, Shape, ShapeType, RGBColor, RGBAColor, Units
 from typing import List, Dict, Any, Optional
-import xml.etree.ElementTree as ET
+
+# Prefer lxml when available: its C tree builder serializes large
+# documents roughly an order of magnitude faster and pretty-prints
+# natively. The stdlib ElementTree fallback keeps lxml optional.
+try:
+    import lxml.etree as ET  # type: ignore[import-not-found]
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET  # type: ignore[no-redef]
+    _HAS_LXML = False
+
+_SVG_NS = 'http://www.w3.org/2000/svg'
+_XLINK_NS = 'http://www.w3.org/1999/xlink'
+
+
+_ID_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+
+@functools.lru_cache(maxsize=8192)
+def _sanitize_id(name: str) -> str:
+    """Sanitize a name for use as an SVG ID, memoizing repeat names."""
+    return _ID_RE.sub('_', name)
+
+
+@functools.lru_cache(maxsize=4096)
+def _rgb_to_svg(r: int, g: int, b: int) -> str:
+    """Format an RGB triple for SVG; documents reuse a handful of colors,
+    so the cache turns per-shape f-string builds into dict hits."""
+    return f"rgb({r},{g},{b})"
+
+
+@functools.lru_cache(maxsize=4096)
+def _transform_to_svg(x: float, y: float, rotation: float,
+                      scale_x: float, scale_y: float) -> str:
+    """Build the SVG transform attribute for a component tuple."""
+    transforms = []
+
+    if x != 0 or y != 0:
+        transforms.append(f"translate({x},{y})")
+
+    if rotation != 0:
+        transforms.append(f"rotate({rotation})")
+
+    if scale_x != 1.0 or scale_y != 1.0:
+        transforms.append(f"scale({scale_x},{scale_y})")
+
+    return ' '.join(transforms)
+
+
+def _svg_color(color) -> str:
+    """Format a color (RGB-like model, raw SVG string, or None) for SVG."""
+    if color is None:
+        return 'none'
+    if isinstance(color, str):
+        return color
+    return f"rgb({color.r},{color.g},{color.b})"
+
+
+class SvgStreamWriter:
+    """
+    Streaming SVG writer for export-only pipelines.
+
+    Element fragments are appended to a string buffer as they are
+    generated, so callers that only need SVG output can skip building
+    the intermediate Shape/document graph entirely. Coordinates are
+    absolute; styling is passed per element.
+    """
+
+    def __init__(self, width: float, height: float):
+        self._parts = [
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">'
+        ]
+
+    def _style_attrs(self, fill, stroke, stroke_width, opacity) -> str:
+        attrs = f' fill="{_svg_color(fill)}" stroke="{_svg_color(stroke)}"'
+        if stroke is not None:
+            attrs += f' stroke-width="{stroke_width}"'
+        if opacity is not None:
+            attrs += f' opacity="{opacity}"'
+        return attrs
+
+    def rect(self, x, y, width, height, fill=None, stroke=None,
+             stroke_width=1.0, rx=0.0, opacity=None):
+        """Append a rectangle."""
+        extra = f' rx="{rx}" ry="{rx}"' if rx else ''
+        self._parts.append(
+            f'<rect x="{x}" y="{y}" width="{width}" height="{height}"{extra}'
+            f'{self._style_attrs(fill, stroke, stroke_width, opacity)}/>'
+        )
+
+    def line(self, x1, y1, x2, y2, stroke, stroke_width=1.0, opacity=None):
+        """Append a line."""
+        self._parts.append(
+            f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}"'
+            f'{self._style_attrs(None, stroke, stroke_width, opacity)}/>'
+        )
+
+    def circle(self, cx, cy, r, fill=None, stroke=None,
+               stroke_width=1.0, opacity=None):
+        """Append a circle."""
+        self._parts.append(
+            f'<circle cx="{cx}" cy="{cy}" r="{r}"'
+            f'{self._style_attrs(fill, stroke, stroke_width, opacity)}/>'
+        )
+
+    def ellipse(self, cx, cy, rx, ry, fill=None, stroke=None,
+                stroke_width=1.0, opacity=None):
+        """Append an ellipse."""
+        self._parts.append(
+            f'<ellipse cx="{cx}" cy="{cy}" rx="{rx}" ry="{ry}"'
+            f'{self._style_attrs(fill, stroke, stroke_width, opacity)}/>'
+        )
+
+    def polygon(self, points, fill=None, stroke=None,
+                stroke_width=1.0, opacity=None):
+        """Append a polygon from an iterable of (x, y) pairs."""
+        points_str = ' '.join(f"{p[0]},{p[1]}" for p in points)
+        self._parts.append(
+            f'<polygon points="{points_str}"'
+            f'{self._style_attrs(fill, stroke, stroke_width, opacity)}/>'
+        )
+
+    def path(self, d, fill=None, stroke=None, stroke_width=1.0, opacity=None):
+        """Append a path from an SVG path data string."""
+        self._parts.append(
+            f'<path d="{d}"'
+            f'{self._style_attrs(fill, stroke, stroke_width, opacity)}/>'
+        )
+
+    def finalize(self) -> str:
+        """Close the document and return the complete SVG string."""
+        return '\n'.join(self._parts) + '\n</svg>'
 
 
 class SVGExporter:
@@ -23,37 +160,196 @@ class SVGExporter:
         self.document = document
         self.svg_root = None
         self.defs = None
+        # Canvas size resolved once per export; _add_background reads it
+        # instead of redoing the unit conversion
+        self._canvas_size = None
+        # Shape-type dispatch table for the element-tree path; one dict
+        # lookup per shape instead of walking an if/elif ladder
+        self._writers = {
+            ShapeType.RECTANGLE: self._add_rectangle,
+            ShapeType.CIRCLE: self._add_circle,
+            ShapeType.ELLIPSE: self._add_ellipse,
+            ShapeType.LINE: self._add_line,
+            ShapeType.POLYGON: self._add_polygon,
+            ShapeType.PATH: self._add_path,
+        }
         
     def export_to_svg(self, filename: str, include_invisible: bool = False) -> str:
         """
         Export document to SVG file.
-        
+
         Args:
             filename: Output SVG filename
             include_invisible: Whether to include invisible layers
-            
+
         Returns:
             SVG content as string
         """
-        svg_content = self.generate_svg_content(include_invisible)
+        svg_content = self.generate_svg_content(include_invisible, pretty=True)
         
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(svg_content)
             
         return svg_content
     
-    def generate_svg_content(self, include_invisible: bool = False) -> str:
-        """Generate SVG content from the document."""
-        
-        # Create SVG root element
-        canvas_width, canvas_height = self._get_canvas_dimensions()
-        self.svg_root = ET.Element('svg', {
-            'xmlns': 'http://www.w3.org/2000/svg',
-            'xmlns:xlink': 'http://www.w3.org/1999/xlink',
+    def export_to_svg_streamed(self, filename: str, include_invisible: bool = False) -> str:
+        """
+        Export document to an SVG file via the streaming serializer.
+
+        Same output shape as export_to_svg but without building an
+        element tree first. The fragment list goes to the file through
+        writelines with a wide buffer, so no merged string is built and
+        the OS sees few large writes.
+        """
+        chunks = self._stream_chunks(include_invisible)
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(chunks)
+
+        return ''.join(chunks)
+
+    def stream_svg_content(self, include_invisible: bool = False) -> str:
+        """
+        Generate SVG content by collecting preformatted fragments.
+
+        Unlike generate_svg_content, no Element objects or attribute
+        dicts are built: each shape becomes a preformatted string, so
+        memory tracks the output size rather than the tree size. Output
+        is compact (no pretty-printing); user-provided strings are
+        XML-escaped.
+        """
+        return ''.join(self._stream_chunks(include_invisible))
+
+    def _stream_chunks(self, include_invisible: bool = False) -> List[str]:
+        """Serialize the document as a list of SVG string fragments."""
+        chunks: List[str] = []
+        write = chunks.append
+
+        self._canvas_size = canvas_width, canvas_height = self._get_canvas_dimensions()
+        write(
+            f'<svg xmlns="{_SVG_NS}" xmlns:xlink="{_XLINK_NS}" '
+            f'width="{canvas_width}" height="{canvas_height}" '
+            f'viewBox="0 0 {canvas_width} {canvas_height}">\n'
+        )
+        write(f'<!-- Generated from: {escape(self.document.metadata.title)} -->\n')
+
+        background = self.document.background
+        if not background.transparent and background.color:
+            write(
+                f'<rect x="0" y="0" width="{canvas_width}" height="{canvas_height}"'
+                f' fill="{self._color_to_svg(background.color)}"/>\n'
+            )
+
+        for layer in self.document.layer_manager.get_layers_by_z_order():
+            if layer.visible or include_invisible:
+                self._write_layer(write, layer)
+
+        write('</svg>\n')
+        return chunks
+
+    def _write_layer(self, write, layer):
+        """Stream one layer as a group element."""
+        opacity = '' if layer.visible else ' opacity="0"'
+        write(f'<g id="layer-{layer.id}" data-name={quoteattr(layer.name)}{opacity}>\n')
+        for shape in layer.shapes:
+            if isinstance(shape, Shape):
+                self._write_shape(write, shape)
+        write('</g>\n')
+
+    def _write_shape(self, write, shape: Shape):
+        """Stream one shape, emitting attribute fragments directly."""
+        geom = shape.geometry
+
+        # Element open tag with geometry attributes; unknown types are
+        # skipped before anything is written
+        shape_type = shape.type
+        if shape_type == ShapeType.RECTANGLE:
+            corner = geom.get('corner_radius', 0)
+            rounded = f' rx="{corner}" ry="{corner}"' if corner else ''
+            write(
+                f'<rect x="0" y="0" width="{geom.get("width", 0)}"'
+                f' height="{geom.get("height", 0)}"{rounded}'
+            )
+        elif shape_type == ShapeType.CIRCLE:
+            write(f'<circle cx="0" cy="0" r="{geom.get("radius", 0)}"')
+        elif shape_type == ShapeType.ELLIPSE:
+            write(
+                f'<ellipse cx="0" cy="0" rx="{geom.get("rx", 0)}"'
+                f' ry="{geom.get("ry", 0)}"'
+            )
+        elif shape_type == ShapeType.LINE:
+            write(
+                f'<line x1="{geom.get("x1", 0)}" y1="{geom.get("y1", 0)}"'
+                f' x2="{geom.get("x2", 0)}" y2="{geom.get("y2", 0)}"'
+            )
+        elif shape_type == ShapeType.POLYGON:
+            points_str = ' '.join(f"{p[0]},{p[1]}" for p in geom.get('points', []))
+            write(f'<polygon points="{points_str}"')
+        elif shape_type == ShapeType.PATH:
+            # escape() alone leaves double quotes intact, which would
+            # terminate the d="..." attribute early
+            path_data = escape(geom.get("path_data", ""), {'"': '&quot;'})
+            write(f'<path d="{path_data}"')
+        else:
+            return
+
+        # Trailing attributes go straight to the fragment list, with no
+        # intermediate concatenated string or attrs dict per shape
+        self._write_style(write, shape.style)
+        transform = self._get_transform_string(shape.transform)
+        if transform:
+            write(f' transform="{transform}"')
+        if shape.name:
+            write(f' id="{self._sanitize_id(shape.name)}"')
+        write('/>\n')
+
+    def _write_style(self, write, style):
+        """Emit the fill/stroke attribute fragments for a streamed element."""
+        if not style:
+            return
+
+        if style.fill:
+            write(f' fill="{self._color_to_svg(style.fill.color)}"')
+            if style.fill.opacity < 1.0:
+                write(f' fill-opacity="{style.fill.opacity}"')
+        else:
+            write(' fill="none"')
+
+        if style.stroke:
+            write(f' stroke="{self._color_to_svg(style.stroke.color)}"')
+            write(f' stroke-width="{style.stroke.width}"')
+            if style.stroke.opacity < 1.0:
+                write(f' stroke-opacity="{style.stroke.opacity}"')
+        else:
+            write(' stroke="none"')
+
+    def generate_svg_content(self, include_invisible: bool = False,
+                             pretty: bool = False) -> str:
+        """
+        Generate SVG content from the document.
+
+        Pretty-printing defaults to off so high-throughput exports skip
+        the indent pass entirely; file exports opt back in.
+        """
+        
+        # Create SVG root element; lxml declares namespaces via nsmap
+        # while stdlib ElementTree takes them as plain xmlns attributes
+        self._canvas_size = canvas_width, canvas_height = self._get_canvas_dimensions()
+        size_attrs = {
             'width': f"{canvas_width}",
             'height': f"{canvas_height}",
             'viewBox': f"0 0 {canvas_width} {canvas_height}"
-        })
+        }
+        if _HAS_LXML:
+            self.svg_root = ET.Element(
+                'svg', size_attrs, nsmap={None: _SVG_NS, 'xlink': _XLINK_NS}
+            )
+        else:
+            self.svg_root = ET.Element('svg', {
+                'xmlns': _SVG_NS,
+                'xmlns:xlink': _XLINK_NS,
+                **size_attrs
+            })
         
         # Add document metadata as comment
         comment = ET.Comment(f" Generated from: {self.document.metadata.title} ")
@@ -71,8 +367,13 @@ class SVGExporter:
             if layer.visible or include_invisible:
                 self._add_layer_to_svg(layer, include_invisible)
         
-        # Convert to string with proper formatting
-        self._indent_xml(self.svg_root)
+        # Convert to string; lxml pretty-prints during serialization,
+        # the stdlib uses its iterative ET.indent over the old recursive
+        # per-element walk
+        if _HAS_LXML:
+            return ET.tostring(self.svg_root, pretty_print=pretty, encoding='unicode')
+        if pretty:
+            ET.indent(self.svg_root, space="  ")
         return ET.tostring(self.svg_root, encoding='unicode', method='xml')
     
     def _get_canvas_dimensions(self) -> tuple[float, float]:
@@ -87,8 +388,8 @@ class SVGExporter:
     def _add_background(self):
         """Add background rectangle if not transparent."""
         if not self.document.background.transparent and self.document.background.color:
-            canvas_width, canvas_height = self._get_canvas_dimensions()
-            
+            canvas_width, canvas_height = self._canvas_size
+
             bg_attrs = {
                 'x': '0',
                 'y': '0',
@@ -97,7 +398,7 @@ class SVGExporter:
                 'fill': self._color_to_svg(self.document.background.color)
             }
             
-            if hasattr(self.document.background, 'image_opacity') and self.document.background.image_opacity < 1.0:
+            if self.document.background.image_opacity < 1.0:
                 bg_attrs['opacity'] = str(self.document.background.image_opacity)
             
             ET.SubElement(self.svg_root, 'rect', bg_attrs)
@@ -106,10 +407,8 @@ class SVGExporter:
         """Add a layer to SVG as a group."""
         
         # Create layer group
-        group_attrs = {'id': f"layer-{layer.id}"}
-        if hasattr(layer, 'name'):
-            group_attrs['data-name'] = layer.name
-        
+        group_attrs = {'id': f"layer-{layer.id}", 'data-name': layer.name}
+
         if not layer.visible:
             group_attrs['opacity'] = '0'
         
@@ -125,20 +424,11 @@ class SVGExporter:
         
         # Apply transform if present
         transform_attr = self._get_transform_string(shape.transform)
-        
-        if shape.type == ShapeType.RECTANGLE:
-            self._add_rectangle(shape, parent_group, transform_attr)
-        elif shape.type == ShapeType.CIRCLE:
-            self._add_circle(shape, parent_group, transform_attr)
-        elif shape.type == ShapeType.ELLIPSE:
-            self._add_ellipse(shape, parent_group, transform_attr)
-        elif shape.type == ShapeType.LINE:
-            self._add_line(shape, parent_group, transform_attr)
-        elif shape.type == ShapeType.POLYGON:
-            self._add_polygon(shape, parent_group, transform_attr)
-        elif shape.type == ShapeType.PATH:
-            self._add_path(shape, parent_group, transform_attr)
-        # Add other shape types as needed
+
+        # Unsupported shape types simply have no writer registered
+        writer = self._writers.get(shape.type)
+        if writer:
+            writer(shape, parent_group, transform_attr)
     
     def _add_rectangle(self, shape: Shape, parent: ET.Element, transform: str):
         """Add rectangle to SVG."""
@@ -277,77 +567,77 @@ class SVGExporter:
         if not style:
             return
         
-        # Handle fill
-        if hasattr(style, 'fill') and style.fill:
-            fill_color = self._color_to_svg(style.fill.color)
-            attrs['fill'] = fill_color
-            
-            if hasattr(style.fill, 'opacity') and style.fill.opacity < 1.0:
+        # Handle fill; pydantic fields always exist, so plain None/truth
+        # checks replace the old hasattr probes
+        if style.fill:
+            attrs['fill'] = self._color_to_svg(style.fill.color)
+
+            if style.fill.opacity < 1.0:
                 attrs['fill-opacity'] = str(style.fill.opacity)
         else:
             attrs['fill'] = 'none'
-        
+
         # Handle stroke
-        if hasattr(style, 'stroke') and style.stroke:
-            stroke_color = self._color_to_svg(style.stroke.color)
-            attrs['stroke'] = stroke_color
+        if style.stroke:
+            attrs['stroke'] = self._color_to_svg(style.stroke.color)
             attrs['stroke-width'] = str(style.stroke.width)
-            
-            if hasattr(style.stroke, 'opacity') and style.stroke.opacity < 1.0:
+
+            if style.stroke.opacity < 1.0:
                 attrs['stroke-opacity'] = str(style.stroke.opacity)
         else:
             attrs['stroke'] = 'none'
     
     def _color_to_svg(self, color) -> str:
-        """Convert color to SVG format."""
-        if hasattr(color, 'r') and hasattr(color, 'g') and hasattr(color, 'b'):
-            return f"rgb({color.r},{color.g},{color.b})"
+        """Convert color to SVG format via the shared memoized formatter."""
+        # One isinstance against the RGB-bearing members of the Color
+        # union instead of three hasattr probes per call
+        if isinstance(color, (RGBColor, RGBAColor)):
+            return _rgb_to_svg(color.r, color.g, color.b)
         return 'black'  # fallback
-    
+
     def _get_transform_string(self, transform) -> str:
-        """Convert transform to SVG format."""
+        """Convert transform to SVG format via the shared memoized builder."""
         if not transform:
             return ''
-        
-        transforms = []
-        
-        # Translation
-        if hasattr(transform, 'x') and hasattr(transform, 'y'):
-            if transform.x != 0 or transform.y != 0:
-                transforms.append(f"translate({transform.x},{transform.y})")
-        
-        # Rotation
-        if hasattr(transform, 'rotation') and transform.rotation != 0:
-            transforms.append(f"rotate({transform.rotation})")
-        
-        # Scale
-        if hasattr(transform, 'scale_x') and hasattr(transform, 'scale_y'):
-            if transform.scale_x != 1.0 or transform.scale_y != 1.0:
-                transforms.append(f"scale({transform.scale_x},{transform.scale_y})")
-        
-        return ' '.join(transforms)
+        return _transform_to_svg(transform.x, transform.y, transform.rotation,
+                                 transform.scale_x, transform.scale_y)
     
     def _sanitize_id(self, name: str) -> str:
-        """Sanitize name for use as SVG ID."""
-        # Replace invalid characters with underscores
-        import re
-        return re.sub(r'[^a-zA-Z0-9_-]', '_', name)
+        """Sanitize name for use as SVG ID via the shared memoized helper."""
+        return _sanitize_id(name)
     
-    def _indent_xml(self, elem: ET.Element, level: int = 0):
-        """Add indentation to XML for pretty printing."""
-        indent = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = indent + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = indent
-            for child in elem:
-                self._indent_xml(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = indent
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = indent
+
+def export_documents_to_svg(documents: List[DrawingDocument], filenames: List[str],
+                            include_invisible: bool = False) -> List[int]:
+    """
+    Export many documents to SVG files in one batch.
+
+    All SVG content is serialized up front (the CPU-bound part), then
+    each file is written with a single buffered writelines call, so the
+    write phase is back-to-back sequential I/O the OS can coalesce.
+
+    Args:
+        documents: Drawing documents to export
+        filenames: Output SVG filename per document
+        include_invisible: Whether to include invisible layers
+
+    Returns:
+        List of written character counts, one per document
+    """
+    if len(documents) != len(filenames):
+        raise ValueError("documents and filenames must have the same length")
+
+    all_chunks = [
+        SVGExporter(document)._stream_chunks(include_invisible)
+        for document in documents
+    ]
+
+    sizes = []
+    for filename, chunks in zip(filenames, all_chunks):
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(chunks)
+        sizes.append(sum(len(chunk) for chunk in chunks))
+    return sizes
 
 
 def export_document_to_svg(document: DrawingDocument, filename: str, include_invisible: bool = False) -> str:
@@ -369,9 +659,17 @@ def export_document_to_svg(document: DrawingDocument, filename: str, include_inv
 if __name__ == "__main__":
     # Example usage
     print("SVG Export Module - Test")
-    
+
     # This would typically be used with a real document
     # from basic_shapes import create_basic_shapes_document
     # doc = create_basic_shapes_document()
     # svg_content = export_document_to_svg(doc, "test_output.svg")
-    # print(f"Exported SVG with {len(svg_content)} characters")
\ No newline at end of file
+    # print(f"Exported SVG with {len(svg_content)} characters")
+
+    # Streaming export without an intermediate document
+    writer = SvgStreamWriter(200.0, 100.0)
+    writer.rect(10.0, 10.0, 80.0, 40.0, fill="rgb(59,130,246)", rx=4.0)
+    writer.circle(150.0, 50.0, 30.0, fill="rgb(16,185,129)")
+    writer.line(10.0, 90.0, 190.0, 90.0, stroke="rgb(0,0,0)", stroke_width=2.0)
+    svg = writer.finalize()
+    print(f"Streamed SVG with {len(svg)} characters")
\ No newline at end of file
@@ -17,6 +17,15 @@ from drawing_lib import (
     DrawingDocument, Shape, ShapeType, Layer,
     RGBColor, FillProperties, StrokeProperties, StyleProperties
 )
+from drawing_lib.types import generate_id
+
+
+def clone_shape(base_shape: Shape, name: str) -> Shape:
+    """Copy a trusted in-memory shape without a dump/validate round-trip."""
+    new_shape = base_shape.model_copy(deep=True)
+    new_shape.id = generate_id()
+    new_shape.name = name
+    return new_shape
 
 
 class TestPerformanceBenchmarks:
@@ -92,18 +101,16 @@ class TestPerformanceBenchmarks:
         # Add shapes in cycles through the sample shapes
         for i in range(num_shapes):
             base_shape = sample_shapes[i % len(sample_shapes)]
-            
+
             # Create a copy with slight variations to avoid identical shapes
-            shape_data = base_shape.model_dump()
-            shape_data.pop('id', None)  # Remove ID to generate new one
-            shape_data['name'] = f"{base_shape.name} {i}"
-            
-            # Vary position slightly
-            if 'transform' in shape_data:
-                shape_data['transform']['x'] = (i % 100) * 2.0
-                shape_data['transform']['y'] = (i // 100) * 2.0
-            
-            new_shape = Shape.model_validate(shape_data)
+            new_shape = clone_shape(base_shape, f"{base_shape.name} {i}")
+
+            # Vary position slightly (Transform is frozen, so derive a copy)
+            if new_shape.transform is not None:
+                new_shape.transform = new_shape.transform.model_copy(
+                    update={'x': (i % 100) * 2.0, 'y': (i // 100) * 2.0}
+                )
+
             main_layer.add_shape(new_shape)
         
         return doc
@@ -119,11 +126,7 @@ class TestPerformanceBenchmarks:
             
             for i in range(1000):
                 base_shape = sample_shapes[i % len(sample_shapes)]
-                shape_data = base_shape.model_dump()
-                shape_data.pop('id', None)  # Remove ID to generate new one
-                shape_data['name'] = f"Shape {i}"
-                
-                new_shape = Shape.model_validate(shape_data)
+                new_shape = clone_shape(base_shape, f"Shape {i}")
                 layer.add_shape(new_shape)
             
             return doc
@@ -140,11 +143,7 @@ class TestPerformanceBenchmarks:
             
             for i in range(2000):
                 base_shape = sample_shapes[i % len(sample_shapes)]
-                shape_data = base_shape.model_dump()
-                shape_data.pop('id', None)  # Remove ID to generate new one
-                shape_data['name'] = f"Shape {i}"
-                
-                new_shape = Shape.model_validate(shape_data)
+                new_shape = clone_shape(base_shape, f"Shape {i}")
                 layer.add_shape(new_shape)
             
             return doc
@@ -179,9 +178,25 @@ class TestPerformanceBenchmarks:
         json_data = benchmark(save_to_json)
         assert len(json_data) > 2000
         assert '"shapes"' in json_data
-    
 
-    
+    @pytest.mark.benchmark(group="save")
+    def test_save_orjson_2000_shapes(self, benchmark, sample_shapes):
+        """Benchmark orjson serialization of 2,000 shapes for comparison.
+
+        Skipped when the optional orjson package is not installed.
+        """
+        orjson = pytest.importorskip("orjson")
+        doc = self.create_test_document_with_shapes(2000, sample_shapes)
+
+        def save_via_orjson():
+            return orjson.dumps(doc.model_dump(mode='json'))
+
+        json_bytes = benchmark(save_via_orjson)
+        assert len(json_bytes) > 2000
+        assert b'"shapes"' in json_bytes
+
+
+
     # LOAD (JSON DESERIALIZATION) BENCHMARKS
     
     @pytest.mark.benchmark(group="load")
@@ -209,9 +224,25 @@ class TestPerformanceBenchmarks:
         loaded_doc = benchmark(load_from_json)
         assert loaded_doc.get_total_shape_count() == 2000
         assert loaded_doc.metadata.title.startswith("Benchmark Document")
-    
 
-    
+    @pytest.mark.benchmark(group="load")
+    def test_load_orjson_2000_shapes(self, benchmark, sample_shapes):
+        """Benchmark orjson deserialization of 2,000 shapes for comparison.
+
+        Skipped when the optional orjson package is not installed.
+        """
+        orjson = pytest.importorskip("orjson")
+        doc = self.create_test_document_with_shapes(2000, sample_shapes)
+        json_bytes = orjson.dumps(doc.model_dump(mode='json'))
+
+        def load_via_orjson():
+            return DrawingDocument.model_validate(orjson.loads(json_bytes))
+
+        loaded_doc = benchmark(load_via_orjson)
+        assert loaded_doc.get_total_shape_count() == 2000
+
+
+
     # MIXED OPERATIONS BENCHMARKS
     
     @pytest.mark.benchmark(group="mixed")
@@ -226,20 +257,12 @@ class TestPerformanceBenchmarks:
             # Add shapes to different layers
             for i in range(500):
                 base_shape = sample_shapes[i % len(sample_shapes)]
-                shape_data = base_shape.model_dump()
-                shape_data.pop('id', None)  # Remove ID to generate new one
-                shape_data['name'] = f"L1 Shape {i}"
-                
-                new_shape = Shape.model_validate(shape_data)
+                new_shape = clone_shape(base_shape, f"L1 Shape {i}")
                 layer1.add_shape(new_shape)
             
             for i in range(500):
                 base_shape = sample_shapes[i % len(sample_shapes)]
-                shape_data = base_shape.model_dump()
-                shape_data.pop('id', None)  # Remove ID to generate new one
-                shape_data['name'] = f"L2 Shape {i}"
-                
-                new_shape = Shape.model_validate(shape_data)
+                new_shape = clone_shape(base_shape, f"L2 Shape {i}")
                 layer2.add_shape(new_shape)
             
             # Serialize and deserialize
@@ -265,11 +288,7 @@ class TestPerformanceBenchmarks:
             for layer_idx, layer in enumerate(layers):
                 for i in range(shapes_per_layer):
                     base_shape = sample_shapes[i % len(sample_shapes)]
-                    shape_data = base_shape.model_dump()
-                    shape_data.pop('id', None)  # Remove ID to generate new one
-                    shape_data['name'] = f"L{layer_idx} Shape {i}"
-                    
-                    new_shape = Shape.model_validate(shape_data)
+                    new_shape = clone_shape(base_shape, f"L{layer_idx} Shape {i}")
                     layer.add_shape(new_shape)
             
             # Serialize and deserialize
@@ -296,11 +315,7 @@ class TestPerformanceBenchmarks:
             for i in range(1000):
                 layer = layers[i % len(layers)]
                 base_shape = sample_shapes[i % len(sample_shapes)]
-                shape_data = base_shape.model_dump()
-                shape_data.pop('id', None)  # Remove ID to generate new one
-                shape_data['name'] = f"Shape {i}"
-                
-                new_shape = Shape.model_validate(shape_data)
+                new_shape = clone_shape(base_shape, f"Shape {i}")
                 layer.add_shape(new_shape)
             
             # Perform layer operations
@@ -167,6 +167,20 @@ class TestDocumentMetadata:
         metadata.update_modified_time()
         assert metadata.modified_at > original_time
 
+    def test_modified_time_round_trips_through_dump(self) -> None:
+        """Test that post-construction updates survive serialization."""
+        metadata = DocumentMetadata()
+
+        import time
+        time.sleep(0.01)
+        metadata.update_modified_time()
+
+        dumped = metadata.model_dump()
+        assert dumped["modified_at"] == metadata.modified_at
+
+        restored = DocumentMetadata.model_validate(dumped)
+        assert restored.modified_at == metadata.modified_at
+
 
 class TestViewSettings:
     """Test ViewSettings model."""
@@ -449,6 +463,24 @@ class TestDrawingDocument:
         duplicate2 = original.duplicate()
         assert duplicate2.metadata.title == "Original Document (Copy)"
 
+    def test_document_duplication_is_deep_copy(self) -> None:
+        """Test that duplicated documents are fully independent."""
+        original = DrawingDocument.create_new(title="Original Document")
+        layer = original.create_layer("Test Layer")
+        shape = Shape(type=ShapeType.CIRCLE, geometry={"radius": 25.0})
+        layer.add_shape(shape)
+
+        duplicate = original.duplicate()
+
+        # Mutating the duplicate's layer tree must not affect the original
+        duplicate.create_layer("Extra Layer")
+        duplicate_layer = duplicate.layer_manager.find_layer_by_id(layer.id)
+        assert duplicate_layer is not None
+        duplicate_layer.clear_shapes()
+
+        assert original.layer_manager.get_layer_count() != duplicate.layer_manager.get_layer_count()
+        assert original.get_total_shape_count() == 1
+
 
 class TestDocumentSerialization:
     """Test document JSON serialization and deserialization."""
@@ -503,7 +535,20 @@ class TestDocumentSerialization:
         
         # Verify shapes
         assert doc2.get_total_shape_count() == 2
-    
+
+    def test_to_json_bytes(self) -> None:
+        """Test direct-to-bytes serialization matches the validated model."""
+        doc = DrawingDocument.create_new(title="Bytes Test")
+        layer = doc.create_layer("Content")
+        layer.add_shape(Shape(type=ShapeType.CIRCLE, geometry={"radius": 10.0}))
+
+        json_bytes = doc.to_json_bytes()
+        assert isinstance(json_bytes, bytes)
+
+        doc2 = DrawingDocument.model_validate_json(json_bytes)
+        assert doc2.metadata.title == "Bytes Test"
+        assert doc2.get_total_shape_count() == 1
+
     def test_preset_document_serialization(self) -> None:
         """Test serialization of preset documents."""
         presets_to_test = ["web", "print_a4", "mobile", "social_instagram"]
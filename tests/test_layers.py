@@ -6,7 +6,7 @@ import pytest
 from typing import List
 
 from drawing_lib.layers import Layer, LayerGroup, LayerManager
-from drawing_lib.shapes import Shape
+from drawing_lib.shapes import Shape, Transform
 from drawing_lib.types import ShapeType, BlendMode
 
 
@@ -74,7 +74,37 @@ class TestLayer:
         # Adding same shape should not duplicate
         layer.add_shape(shape)
         assert len(layer.shapes) == 2
-    
+
+    def test_add_shapes_bulk(self) -> None:
+        """Test adding many shapes in one call."""
+        layer = Layer(name="Test Layer")
+        shapes = [
+            Shape(type=ShapeType.CIRCLE, geometry={"radius": float(r)})
+            for r in (10, 20, 30)
+        ]
+
+        layer.add_shapes(shapes)
+        assert len(layer.shapes) == 3
+
+        # Duplicates within a later batch are skipped
+        layer.add_shapes([shapes[0], "extra-shape-id"])
+        assert len(layer.shapes) == 4
+        assert "extra-shape-id" in layer.shapes
+
+    def test_shapes_reassignment_reseeds_membership(self) -> None:
+        """Test that replacing the shapes list resets duplicate tracking."""
+        layer = Layer(name="Test Layer")
+        shape = Shape(type=ShapeType.CIRCLE, geometry={"radius": 25.0})
+        layer.add_shape(shape)
+
+        # Reassign the list outright; the old shape is no longer present
+        layer.shapes = []
+        assert layer.get_shape_count() == 0
+
+        # Re-adding the same shape must succeed, not be dropped as a dup
+        layer.add_shape(shape)
+        assert layer.get_shape_count() == 1
+
     def test_remove_shape(self) -> None:
         """Test removing shapes from layer."""
         layer = Layer(name="Test Layer")
@@ -401,6 +431,44 @@ class TestLayerManager:
         assert layer.parent_id == group.id
         assert len(group.get_all_layers()) == 1
     
+    def test_summary_cache_invalidation(self) -> None:
+        """Test that summary() stays correct as layers mutate."""
+        manager = LayerManager()
+        layer = manager.create_layer("Layer 1")
+
+        assert manager.summary() == (1, 0, 1, ["Layer 1"])
+
+        # Adding a shape must invalidate the cached summary
+        layer.add_shape(Shape(type=ShapeType.CIRCLE, geometry={"radius": 5.0}))
+        assert manager.summary() == (1, 1, 1, [])
+
+        # So must toggling visibility and structural changes
+        layer.visible = False
+        assert manager.summary() == (1, 1, 0, [])
+
+        manager.create_layer("Layer 2")
+        assert manager.summary() == (2, 1, 1, ["Layer 2"])
+
+    def test_children_reassignment_invalidates_caches(self) -> None:
+        """Test that replacing a group's children updates manager views."""
+        manager = LayerManager()
+        layer = manager.create_layer("Layer 1")
+        assert len(manager.get_all_layers()) == 1
+
+        # Reassign the list outright; cached views must not see the old tree
+        manager.root_group.children = []
+        assert manager.get_all_layers() == []
+        assert manager.find_layer_by_id(layer.id) is None
+        assert manager.summary() == (0, 0, 0, [])
+
+        # Newly assigned children are attached back to the manager, so
+        # their mutations keep invalidating its caches
+        new_layer = Layer(name="Layer 2")
+        manager.root_group.children = [new_layer]
+        assert manager.get_all_layers() == [new_layer]
+        new_layer.add_shape(Shape(type=ShapeType.CIRCLE, geometry={"radius": 5.0}))
+        assert manager.summary() == (1, 1, 1, [])
+
     def test_delete_layer(self) -> None:
         """Test deleting layers through manager."""
         manager = LayerManager()
@@ -593,4 +661,124 @@ class TestLayerSerialization:
         assert manager2.active_layer_id == layer1.id
         found_group = manager2.find_group_by_id(group.id)
         assert found_group is not None
-        assert len(found_group.children) == 1
\ No newline at end of file
+        assert len(found_group.children) == 1
+
+class TestSpatialIndex:
+    """Test spatial index queries through the layer manager."""
+
+    def _make_manager_with_shapes(self) -> LayerManager:
+        """Build a manager with shapes spread across the canvas."""
+        manager = LayerManager()
+        layer = manager.create_layer("Shapes")
+        for i in range(20):
+            shape = Shape(
+                type=ShapeType.RECTANGLE,
+                geometry={"width": 10.0, "height": 10.0},
+                transform=Transform(x=i * 100.0, y=i * 100.0)
+            )
+            layer.add_shape(shape)
+        return manager
+
+    def test_query_bounds(self) -> None:
+        """Test rectangle queries return only intersecting shapes."""
+        manager = self._make_manager_with_shapes()
+
+        # First three shapes sit at (0,0), (100,100), (200,200)
+        results = manager.query_bounds((0.0, 0.0, 250.0, 250.0))
+        assert len(results) == 3
+
+        # Empty region
+        assert manager.query_bounds((5000.0, 5000.0, 6000.0, 6000.0)) == []
+
+    def test_query_point(self) -> None:
+        """Test point hit-testing with and without margin."""
+        manager = self._make_manager_with_shapes()
+
+        hits = manager.query_point(305.0, 305.0)
+        assert len(hits) == 1
+        assert hits[0].transform.x == 300.0
+
+        # Margin expands the hit area to reach the neighbouring shapes
+        assert len(manager.query_point(305.0, 305.0, margin=100.0)) == 3
+
+    def test_unbounded_shapes_are_skipped(self) -> None:
+        """Test that shapes without computable bounds don't break the index."""
+        manager = LayerManager()
+        layer = manager.create_layer("Mixed")
+        layer.add_shape(Shape(
+            type=ShapeType.RECTANGLE,
+            geometry={"width": 50.0, "height": 50.0}
+        ))
+        layer.add_shape(Shape(
+            type=ShapeType.PATH,
+            geometry={"path_data": "M 0,0 L 10,10"}
+        ))
+
+        # The path has no bounds, so only the rectangle is indexed
+        assert len(manager.get_spatial_index()) == 1
+        results = manager.query_bounds((0.0, 0.0, 100.0, 100.0))
+        assert len(results) == 1
+        assert results[0].type == ShapeType.RECTANGLE
+
+    def test_index_invalidated_on_structure_change(self) -> None:
+        """Test that structural changes rebuild the index."""
+        manager = self._make_manager_with_shapes()
+        assert len(manager.get_spatial_index()) == 20
+
+        layer = manager.create_layer("More Shapes")
+        layer.add_shape(Shape(type=ShapeType.CIRCLE, geometry={"radius": 5.0}))
+
+        # create_layer invalidated the cached index, so the rebuild sees
+        # the new shape
+        assert len(manager.get_spatial_index()) == 21
+
+    def test_rebuild_after_shape_edit(self) -> None:
+        """Test explicit rebuild after shape-level edits."""
+        manager = self._make_manager_with_shapes()
+        index = manager.get_spatial_index()
+        assert len(index) == 20
+
+        layer = manager.get_all_layers()[0]
+        layer.add_shape(Shape(type=ShapeType.CIRCLE, geometry={"radius": 5.0}))
+
+        # Shape-level edits do not notify the manager; rebuild explicitly
+        assert len(manager.get_spatial_index()) == 20
+        assert len(manager.rebuild_spatial_index()) == 21
+
+
+class TestGroupBounds:
+    """Test aggregate bounds over layer groups."""
+
+    def test_get_bounds_aggregates_shapes(self) -> None:
+        """Test combined bounds across layers and nested groups."""
+        group = LayerGroup(name="Group")
+        layer = Layer(name="Layer")
+        layer.add_shape(Shape(
+            type=ShapeType.RECTANGLE,
+            geometry={"width": 10.0, "height": 10.0}
+        ))
+        group.add_child(layer)
+
+        nested = LayerGroup(name="Nested")
+        nested_layer = Layer(name="Nested Layer")
+        nested_layer.add_shape(Shape(
+            type=ShapeType.CIRCLE,
+            geometry={"radius": 5.0},
+            transform=Transform(x=100.0, y=100.0)
+        ))
+        nested.add_child(nested_layer)
+        group.add_child(nested)
+
+        assert group.get_bounds() == (0.0, 0.0, 105.0, 105.0)
+        assert group.get_bounds(recursive=False) == (0.0, 0.0, 10.0, 10.0)
+
+    def test_get_bounds_empty_group(self) -> None:
+        """Test that a group without shapes has no bounds."""
+        group = LayerGroup(name="Empty")
+        assert group.get_bounds() is None
+
+        # Bare shape IDs carry no geometry
+        layer = Layer(name="IDs Only")
+        layer.add_shape("shape-id")
+        group.add_child(layer)
+        assert group.get_bounds() is None
@@ -2,6 +2,7 @@
 Tests for the component-based shape system.
 """
 
+import json
 import pytest
 from typing import Dict, Any
 
@@ -298,10 +299,45 @@ class TestShapeProperties:
         """Test bounding box calculation for polyline."""
         geometry = {"points": [[10.0, 20.0], [50.0, 5.0], [30.0, 40.0]]}
         shape = Shape(type=ShapeType.POLYLINE, geometry=geometry)
-        
+
         bounds = shape.get_bounds()
         assert bounds == (10.0, 5.0, 50.0, 40.0)
 
+    def test_bounds_cache_invalidation(self) -> None:
+        """Test cached bounds refresh when transform is replaced."""
+        geometry = {"width": 100.0, "height": 50.0}
+        shape = Shape(type=ShapeType.RECTANGLE, geometry=geometry)
+
+        assert shape.get_bounds() == (0.0, 0.0, 100.0, 50.0)
+        # Repeated call hits the cache
+        assert shape.get_bounds() == (0.0, 0.0, 100.0, 50.0)
+
+        shape.transform = Transform(x=10.0, y=20.0)
+        assert shape.get_bounds() == (10.0, 20.0, 110.0, 70.0)
+
+    def test_typed_geometry_view(self) -> None:
+        """Test typed geometry views over the geometry dict."""
+        from drawing_lib.shapes import RectangleGeometry, PolygonGeometry
+
+        rect = Shape(
+            type=ShapeType.RECTANGLE,
+            geometry={"width": 100.0, "height": 50.0, "corner_radius": 5.0}
+        )
+        rect_geom = rect.typed_geometry
+        assert isinstance(rect_geom, RectangleGeometry)
+        assert rect_geom.width == 100.0
+        assert rect_geom.corner_radius == 5.0
+        # Cached on repeat access
+        assert rect.typed_geometry is rect_geom
+
+        polygon = Shape(
+            type=ShapeType.POLYGON,
+            geometry={"points": [[0.0, 0.0], [10.0, 0.0], [5.0, 10.0]]}
+        )
+        poly_geom = polygon.typed_geometry
+        assert isinstance(poly_geom, PolygonGeometry)
+        assert poly_geom.points == ((0.0, 0.0), (10.0, 0.0), (5.0, 10.0))
+
 
 class TestShapeSerialization:
     """Test shape JSON serialization and deserialization."""
@@ -349,4 +385,17 @@ class TestShapeSerialization:
         assert shape2.style.fill.color.r == 255
         assert shape2.style.stroke.width == 2.0
         assert shape2.transform.rotation == 45.0
-        assert shape2.name == "Styled Circle"
\ No newline at end of file
+        assert shape2.name == "Styled Circle"
+
+def test_load_many() -> None:
+    """Test bulk JSON loading of shapes via the precompiled adapter."""
+    shapes = [
+        Shape(type=ShapeType.RECTANGLE, geometry={"width": 10.0, "height": 5.0}),
+        Shape(type=ShapeType.CIRCLE, geometry={"radius": 3.0}),
+    ]
+    json_data = json.dumps([shape.model_dump() for shape in shapes])
+
+    loaded = Shape.load_many(json_data)
+    assert len(loaded) == 2
+    assert loaded[0].type == ShapeType.RECTANGLE
+    assert loaded[1].geometry["radius"] == 3.0
@@ -0,0 +1,42 @@
+"""Test the structure-of-arrays layer."""
+
+from drawing_lib.soa import CIRCLE, LINE, RECT, SoALayer
+
+
+class TestSoALayer:
+    """Test column-oriented shape storage."""
+
+    def test_append_and_rows(self) -> None:
+        """Test appending shapes and reading rows back."""
+        layer = SoALayer(name="Bars")
+        layer.append(RECT, 10.0, 20.0, (80.0, 40.0, 4.0),
+                     fill_rgba=(59, 130, 246, 255))
+        layer.append(CIRCLE, 150.0, 50.0, (30.0,),
+                     fill_rgba=(16, 185, 129, 255))
+        layer.append(LINE, 0.0, 90.0, (190.0, 90.0),
+                     stroke_rgba=(0, 0, 0, 255), stroke_width=2.0)
+
+        assert len(layer) == 3
+
+        rows = list(layer.rows())
+        kind, tx, ty, params, fill, stroke, stroke_w = rows[0]
+        assert kind == RECT
+        assert (tx, ty) == (10.0, 20.0)
+        assert params == (80.0, 40.0, 4.0)
+        assert fill == (59, 130, 246, 255)
+        assert stroke == (0, 0, 0, 0)
+
+        assert rows[1][0] == CIRCLE
+        assert rows[1][3][0] == 30.0
+
+        assert rows[2][5] == (0, 0, 0, 255)
+        assert rows[2][6] == 2.0
+
+    def test_subpixel_precision(self) -> None:
+        """Test coordinates survive fixed-point quantization."""
+        layer = SoALayer()
+        layer.append(RECT, 10.5, 20.25, (80.125, 40.0, 0.0))
+
+        _, tx, ty, params, _, _, _ = next(layer.rows())
+        assert (tx, ty) == (10.5, 20.25)
+        assert params[0] == 80.125
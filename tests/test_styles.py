@@ -40,7 +40,22 @@ class TestColorModels:
         assert color.s == 50.0
         assert color.l == 75.0
         assert color.to_css() == "hsl(180.0, 50.0%, 75.0%)"
-    
+
+    def test_hsl_to_rgb(self) -> None:
+        """Test HSL to RGB conversion."""
+        assert HSLColor(h=0.0, s=100.0, l=50.0).to_rgb().to_tuple() == (255, 0, 0)
+        assert HSLColor(h=120.0, s=100.0, l=50.0).to_rgb().to_tuple() == (0, 255, 0)
+        assert HSLColor(h=240.0, s=100.0, l=50.0).to_rgb().to_tuple() == (0, 0, 255)
+
+        # Zero saturation is a grey determined by lightness alone
+        assert HSLColor(h=200.0, s=0.0, l=50.0).to_rgb().to_tuple() == (128, 128, 128)
+
+    def test_hsl_to_rgb_batch(self) -> None:
+        """Test bulk HSL to RGB conversion."""
+        colors = [HSLColor(h=h, s=100.0, l=50.0) for h in (0.0, 120.0, 240.0)]
+        rgb = HSLColor.to_rgb_batch(colors)
+        assert [c.to_tuple() for c in rgb] == [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
     def test_hex_color_valid(self) -> None:
         """Test valid hex color inputs."""
         # Test 6-character hex
@@ -79,6 +94,9 @@ class TestColorModels:
         with pytest.raises(InvalidStyleError):
             HexColor(value="#FF8040ABC")  # Too long
 
+        with pytest.raises(InvalidStyleError):
+            HexColor(value="١٢٣٤٥٦")  # Non-ASCII digits are not hex
+
 
 class TestGradients:
     """Test gradient models."""